@@ -8,26 +8,62 @@ and retrieval of reports.
 
 __version__ = "0.1.0"
 
-from .client import BridgeIQClient, AsyncBridgeIQClient
-from .environment import Environment
-from .models import (
-    AnalysisRequest,
-    AnalysisStatus,
-    AnalysisStatusEnum,
-    ReportStatusEnum,
-    PDFStatusEnum,
-)
-from .exceptions import (
-    BridgeIQError,
-    AuthenticationError,
-    ConnectionError,
-    TimeoutError,
-    ResourceNotFoundError,
-    ValidationError,
-    InsufficientTokensError,
+import importlib.util
+import sys
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Let type checkers and IDEs resolve the lazy exports statically.
+    from .client import AsyncBridgeIQClient, BridgeIQClient
+    from .environment import Environment
+    from .exceptions import (
+        AuthenticationError,
+        BridgeIQError,
+        ConnectionError,
+        InsufficientTokensError,
+        ResourceNotFoundError,
+        TimeoutError,
+        ValidationError,
+    )
+    from .models import (
+        AnalysisRequest,
+        AnalysisStatus,
+        AnalysisStatusEnum,
+        PDFStatusEnum,
+        ReportStatusEnum,
+        StatusLite,
+    )
+
+# Public names are resolved lazily (PEP 562) so that ``import bridge_iq``
+# does not pull in httpx, requests or pydantic until they are needed.
+_DISPATCH = MappingProxyType({
+    "BridgeIQClient": "client",
+    "AsyncBridgeIQClient": "client",
+    "Environment": "environment",
+    "AnalysisRequest": "models",
+    "AnalysisStatus": "models",
+    "AnalysisStatusEnum": "models",
+    "ReportStatusEnum": "models",
+    "PDFStatusEnum": "models",
+    "StatusLite": "models",
+    "BridgeIQError": "exceptions",
+    "AuthenticationError": "exceptions",
+    "ConnectionError": "exceptions",
+    "TimeoutError": "exceptions",
+    "ResourceNotFoundError": "exceptions",
+    "ValidationError": "exceptions",
+    "InsufficientTokensError": "exceptions",
+})
+
+# Submodules reachable as attributes (``bridge_iq.models``) without an
+# explicit import; their bodies only run on first attribute access.
+_SUBMODULES = frozenset(
+    {"client", "environment", "exceptions", "logger", "models", "utils"}
 )
 
-__all__ = [
+__all__ = (
     "BridgeIQClient",
     "AsyncBridgeIQClient",
     "Environment",
@@ -36,6 +72,7 @@ __all__ = [
     "AnalysisStatusEnum",
     "ReportStatusEnum",
     "PDFStatusEnum",
+    "StatusLite",
     "BridgeIQError",
     "AuthenticationError",
     "ConnectionError",
@@ -43,4 +80,53 @@ __all__ = [
     "ResourceNotFoundError",
     "ValidationError",
     "InsufficientTokensError",
-] 
\ No newline at end of file
+)
+
+
+def _lazy_module(name):
+    """Return a submodule whose code executes on first attribute access.
+    
+    Args:
+        name: Submodule name relative to this package
+        
+    Returns:
+        The (possibly not yet executed) submodule object
+    """
+    fullname = f"{__name__}.{name}"
+    module = sys.modules.get(fullname)
+    if module is None:
+        spec = importlib.util.find_spec(fullname)
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[fullname] = module
+        loader.exec_module(module)
+    return module
+
+
+def __getattr__(
+    name,
+    _dispatch=_DISPATCH,
+    _import=import_module,
+    _package=__name__,
+    _globals=globals(),
+):
+    """Import public names on first access and cache them in the module.
+    
+    Cached names become plain module attributes, so this hook only runs
+    once per name; the defaults bind lookups as fast locals.
+    """
+    submodule = _dispatch.get(name)
+    if submodule is not None:
+        obj = getattr(_import("." + submodule, _package), name)
+    elif name in _SUBMODULES:
+        obj = _lazy_module(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _globals[name] = obj
+    return obj
+
+
+def __dir__():
+    """List lazily exported names alongside the module attributes."""
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -0,0 +1,113 @@
+"""
+Response decoding and error mapping for the BridgeIQ clients.
+
+This module turns API responses into data or exceptions. It relies only on
+the attributes that requests and httpx responses share, so the sync and
+async clients use the same implementation.
+"""
+import json
+import logging
+from typing import Any, NoReturn
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .exceptions import (
+    AuthenticationError,
+    BridgeIQError,
+    InsufficientTokensError,
+    ResourceNotFoundError,
+    TimeoutError,
+    ValidationError,
+)
+
+# Exception type and message prefix for each documented error status
+_STATUS_EXC = {
+    400: (ValidationError, "Validation error"),
+    401: (AuthenticationError, "Authentication failed"),
+    402: (InsufficientTokensError, "Insufficient tokens"),
+    404: (ResourceNotFoundError, "Resource not found"),
+    408: (TimeoutError, "Request timed out"),
+    504: (TimeoutError, "Request timed out"),
+}
+
+
+def parse_json(response: Any) -> Any:
+    """Decode a JSON response body.
+    
+    Uses orjson when it is installed and falls back to the stdlib decoder
+    otherwise. Both decode the raw body bytes directly, skipping the str
+    conversion done by ``response.json()``. Works for both requests and
+    httpx responses.
+    
+    Args:
+        response: Response object with a fully read body
+        
+    Returns:
+        Decoded JSON data
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def body_text(response: Any) -> str:
+    """Decode a response body as UTF-8 for logging and error messages.
+    
+    Unlike ``requests.Response.text``, this skips charset detection, which
+    is slow and pointless for the API's UTF-8 JSON bodies.
+    
+    Args:
+        response: Response object with a fully read body
+        
+    Returns:
+        Body text, with undecodable bytes replaced
+    """
+    return response.content.decode("utf-8", errors="replace")
+
+
+def raise_for_response(
+    response: Any, logger: logging.Logger, context: str
+) -> NoReturn:
+    """Raise the exception matching an API error response.
+    
+    Works for both requests and httpx responses.
+    
+    Args:
+        response: Response object from failed request, with its body read
+        logger: Logger to report the error on
+        context: Context string for logging
+        
+    Raises:
+        Appropriate exception based on response status and content
+    """
+    if not response.content:
+        message = "Unknown error"
+        data = {"message": message}
+    else:
+        try:
+            data = parse_json(response)
+            message = data.get("message", "Unknown error")
+        except (ValueError, KeyError, AttributeError):
+            message = body_text(response) or "Unknown error"
+            data = {"message": message}
+        
+    # Log the error response
+    status_code = response.status_code
+    logger.error("API error (%s) during %s: %s", status_code, context, message)
+    
+    # Raise appropriate exception based on status code
+    exc_type, prefix = _STATUS_EXC.get(status_code, (BridgeIQError, None))
+    if prefix is None:
+        if 500 <= status_code < 600:
+            prefix = f"Server error ({status_code})"
+        else:
+            prefix = f"API error ({status_code})"
+    raise exc_type(
+        f"{prefix}: {message}", response=data, status_code=status_code
+    )
@@ -0,0 +1,47 @@
+"""
+Shared HTTP connection pools for the async BridgeIQ client.
+
+Async clients created with ``share_client=True`` reuse one httpx.AsyncClient
+per base URL instead of opening their own pool, so short-lived client
+instances do not pay a new TCP and TLS handshake on every request. httpx
+connections are bound to the event loop they were opened on, so shared
+clients are kept per running loop.
+"""
+import asyncio
+import weakref
+from typing import TYPE_CHECKING, Callable, Hashable
+
+if TYPE_CHECKING:
+    import httpx
+
+# Shared clients by event loop, then by caller-provided key
+_SHARED: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_shared_client(
+    key: Hashable, factory: Callable[[], "httpx.AsyncClient"]
+) -> "httpx.AsyncClient":
+    """Return the shared client for a key on the running event loop.
+    
+    Args:
+        key: Identifies which clients may share a pool
+        factory: Creates the client if none is open for the key yet
+    
+    Returns:
+        Shared async HTTP client
+    
+    Raises:
+        RuntimeError: If called without a running event loop
+    """
+    clients = _SHARED.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = clients[key] = factory()
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close every shared client created on the running event loop."""
+    clients = _SHARED.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
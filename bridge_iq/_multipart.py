@@ -0,0 +1,178 @@
+"""
+Streaming multipart/form-data bodies for the BridgeIQ clients.
+
+requests encodes ``files=`` uploads into a single in-memory bytes object,
+which doubles memory use for large scans. This module provides a read-only,
+seekable file-like body that produces the same encoding while reading the
+image from its source on demand.
+"""
+import os
+import zlib
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Chunk size used when the body is consumed by iteration
+_ITER_CHUNK_SIZE = 1024 * 1024
+
+# zlib window bits selecting a gzip container
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def _quote(value: str) -> str:
+    """Escape a header parameter value the way browsers do."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', "%22")
+        .replace("\r", "%0D")
+        .replace("\n", "%0A")
+    )
+
+
+class MultipartStream:
+    """Multipart/form-data body that streams a single file part.
+    
+    The body exposes ``__len__``, ``read``, ``tell`` and ``seek`` so that
+    requests sends it with a Content-Length and urllib3 can rewind it when
+    a request is retried.
+    """
+    
+    def __init__(
+        self,
+        fields: Dict[str, str],
+        file_field: str,
+        filename: str,
+        source: Any,
+        size: int,
+        boundary: str = "",
+    ):
+        """Initialize the multipart body.
+        
+        Args:
+            fields: Plain form fields sent before the file part
+            file_field: Form field name of the file part
+            filename: Filename reported for the file part
+            source: Open binary file positioned at the start of the data,
+                or a bytes-like object
+            size: Number of bytes to send from source
+            boundary: Optional multipart boundary; random if empty
+        """
+        self.boundary = boundary or os.urandom(16).hex()
+        delimiter = f"--{self.boundary}\r\n".encode()
+        
+        # Encode everything except the file contents up front
+        head = b"".join(
+            delimiter
+            + f'Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'.encode()
+            + str(value).encode()
+            + b"\r\n"
+            for name, value in fields.items()
+        )
+        head += delimiter + (
+            f'Content-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(filename)}"\r\n\r\n'
+        ).encode()
+        tail = f"\r\n--{self.boundary}--\r\n".encode()
+        
+        # Each segment is (start offset, length, source, offset in source)
+        base = source.tell() if hasattr(source, "read") else 0
+        self._segments: List[Tuple[int, int, Any, int]] = [
+            (0, len(head), head, 0),
+            (len(head), size, source, base),
+            (len(head) + size, len(tail), tail, 0),
+        ]
+        self._size = len(head) + size + len(tail)
+        self._position = 0
+    
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value for this body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+    
+    def __len__(self) -> int:
+        """Return the total body length in bytes."""
+        return self._size
+    
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the remaining body in chunks."""
+        while True:
+            chunk = self.read(_ITER_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+    
+    def tell(self) -> int:
+        """Return the current position in the body."""
+        return self._position
+    
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Move to a new position in the body.
+        
+        Args:
+            offset: Offset relative to whence
+            whence: os.SEEK_SET, os.SEEK_CUR or os.SEEK_END
+        
+        Returns:
+            The new absolute position
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._size
+        self._position = min(max(offset, 0), self._size)
+        return self._position
+    
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the body.
+        
+        Args:
+            size: Maximum number of bytes to read; all remaining if negative
+        
+        Returns:
+            The bytes read, empty at the end of the body
+        
+        Raises:
+            IOError: If the file ends before the declared size
+        """
+        if size is None or size < 0:
+            size = self._size - self._position
+        
+        chunks = []
+        while size > 0 and self._position < self._size:
+            # Find the segment containing the current position
+            for start, length, source, base in self._segments:
+                if start <= self._position < start + length:
+                    break
+            offset = self._position - start
+            count = min(size, length - offset)
+            
+            if hasattr(source, "read"):
+                source.seek(base + offset)
+                chunk = source.read(count)
+                if not chunk:
+                    raise IOError("File ended before the expected upload size")
+            else:
+                chunk = source[offset:offset + count]
+            
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+        
+        return b"".join(chunks)
+
+
+def gzip_body(body: MultipartStream, level: int = 6) -> bytes:
+    """Gzip a multipart body for sending with Content-Encoding: gzip.
+    
+    The body is compressed chunk by chunk, so only the compressed result
+    is held in memory.
+    
+    Args:
+        body: Multipart body positioned at its start
+        level: zlib compression level
+    
+    Returns:
+        The gzip-compressed body
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    chunks = [compressor.compress(chunk) for chunk in body]
+    chunks.append(compressor.flush())
+    return b"".join(chunks)
@@ -5,34 +5,428 @@ This module provides the main client classes for interacting with the
 BridgeIQ API, including both synchronous and asynchronous implementations.
 """
 import asyncio
+import importlib.util
 import json
 import logging
 import os
+import random
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-from urllib.parse import urljoin
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urljoin, urlsplit
 from uuid import UUID
 
-import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ._errors import body_text, parse_json, raise_for_response
+from ._http import close_shared_clients, get_shared_client
+from ._multipart import MultipartStream, gzip_body
 from .environment import Environment
 from .exceptions import (
-    AuthenticationError,
     ConnectionError,
-    InsufficientTokensError,
-    ResourceNotFoundError,
     BridgeIQError,
     TimeoutError,
-    ValidationError,
 )
 from .logger import get_logger
-from .models import AnalysisRequest, AnalysisStatus, AnalysisResult
-from .utils import get_file_content, get_user_agent, is_dicom_file, save_file
+from .models import AnalysisRequest, AnalysisStatus, AnalysisResult, StatusLite
+from .utils import (
+    dicom_transfer_syntax,
+    get_user_agent,
+    is_dicom_file,
+    open_partial_file,
+    save_stream,
+)
+
+if TYPE_CHECKING:
+    # httpx (and its TLS/anyio stack) is only imported once the async
+    # client is actually used.
+    import httpx
+
+# Setting a header to None drops the session-level value for one request
+_NO_AUTH_HEADERS = {"client-id": None, "client-secret": None}
+
+# The async client negotiates HTTP/2 when the optional h2 package is
+# installed (pip install bridge-iq-client[http2]) and uses HTTP/1.1 otherwise
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Image arguments of these types are file paths; anything else is raw data
+_PATH_TYPES = (str, os.PathLike)
+
+# Upper bound on status checks in flight for the batched async helpers
+_MAX_CONCURRENT_STATUS_CHECKS = 16
+
+# Sync uploads larger than this are streamed instead of encoded in memory
+_STREAM_UPLOAD_THRESHOLD = 8 * 1024 * 1024
+
+# Cached status entry: (ETag, Last-Modified, parsed status)
+_CachedStatus = Tuple[Optional[str], Optional[str], AnalysisStatus]
+
+# Number of in-progress statuses kept for conditional status checks
+_STATUS_CACHE_SIZE = 256
+
+# Delay before the second status poll; later polls back off to poll_interval
+_FIRST_POLL_DELAY = 0.25
+
+# Growth steps after which the poll delay has long passed any sane
+# poll_interval; capping the exponent keeps 1.5 ** attempt from overflowing
+_MAX_POLL_GROWTH_STEPS = 64
+
+# Reports are streamed to disk in chunks of this size; large enough that
+# the async client's per-chunk thread hand-off stays cheap
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Async uploads read image files in chunks of this size
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Bytes read from an image to find its DICOM transfer syntax
+_DICOM_HEADER_SIZE = 4096
+
+# Transfer syntaxes with uncompressed pixel data, which gzip shrinks well
+_UNCOMPRESSED_TRANSFER_SYNTAXES = frozenset({
+    "1.2.840.10008.1.2",  # Implicit VR Little Endian
+    "1.2.840.10008.1.2.1",  # Explicit VR Little Endian
+    "1.2.840.10008.1.2.2",  # Explicit VR Big Endian
+})
+
+
+def _check_base_url(base_url: str) -> None:
+    """Validate the API base URL once, before any endpoint is derived.
+    
+    Args:
+        base_url: Base URL for API requests
+        
+    Raises:
+        ValueError: If base_url is not an absolute http(s) URL
+    """
+    parts = urlsplit(base_url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        raise ValueError(f"Invalid base URL: {base_url!r}")
+
+
+def _prepare_image(
+    image_path: Union[str, Path, bytes], logger: logging.Logger
+) -> Tuple[str, int, Union[BinaryIO, bytes]]:
+    """Resolve the upload name, size and body of an image.
+    
+    Files are returned as open handles so the image is read in chunks
+    rather than copied into memory; the caller must close them.
+    
+    Args:
+        image_path: Path to the image file or raw image bytes
+        logger: Logger to report the image source on
+        
+    Returns:
+        Tuple of (filename, size in bytes, open file or the given bytes)
+        
+    Raises:
+        FileNotFoundError: If the image file doesn't exist
+    """
+    if isinstance(image_path, _PATH_TYPES):
+        logger.info("Reading image from %s", image_path)
+        image_file = open(image_path, "rb")
+        return (
+            os.path.basename(image_path),
+            os.fstat(image_file.fileno()).st_size,
+            image_file,
+        )
+    
+    logger.info("Using provided image data")
+    return "image.dcm", len(image_path), image_path
+
+
+def _gzip_upload(
+    form_data: Dict[str, str],
+    filename: str,
+    image_data: Union[BinaryIO, bytes],
+    size: int,
+) -> Optional[Tuple[bytes, str]]:
+    """Gzip the multipart upload of an uncompressed DICOM image.
+    
+    Images with compressed pixel data (JPEG, JPEG 2000, RLE) or that are
+    not DICOM at all gain little from gzip and are left alone.
+    
+    Args:
+        form_data: Plain form fields of the upload
+        filename: Filename reported for the image part
+        image_data: Open binary file at the start of the image, or bytes
+        size: Image size in bytes
+        
+    Returns:
+        Tuple of (compressed body, Content-Type), or None if the image
+        should be sent uncompressed
+    """
+    # Peek at the file meta header without moving the file position
+    if hasattr(image_data, "read"):
+        position = image_data.tell()
+        header = image_data.read(_DICOM_HEADER_SIZE)
+        image_data.seek(position)
+    else:
+        header = image_data[:_DICOM_HEADER_SIZE]
+    
+    if dicom_transfer_syntax(header) not in _UNCOMPRESSED_TRANSFER_SYNTAXES:
+        return None
+    
+    body = MultipartStream(form_data, "image", filename, image_data, size)
+    return gzip_body(body), body.content_type
+
+
+async def _read_in_thread(body: MultipartStream) -> AsyncIterator[bytes]:
+    """Yield a multipart body in chunks read on a worker thread.
+    
+    httpx reads ``files=`` uploads synchronously on the event loop; this
+    keeps the disk reads of large images off it.
+    
+    Args:
+        body: Multipart body positioned at its start
+        
+    Yields:
+        Consecutive chunks of the body
+    """
+    while True:
+        chunk = await asyncio.to_thread(body.read, _UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _poll_delay(
+    attempt: int,
+    poll_interval: float,
+    remaining: float,
+    rng: random.Random,
+) -> float:
+    """Compute the sleep before the next status poll.
+    
+    Starts at 250 ms and grows by 1.5x per poll up to poll_interval, so
+    short analyses are picked up quickly while long ones are polled at the
+    normal rate. Up to half of each delay is jittered so clients started
+    together do not poll in lockstep.
+    
+    Args:
+        attempt: Number of non-terminal status checks so far (0-based)
+        poll_interval: Longest delay between status checks in seconds
+        remaining: Seconds left before the wait times out
+        rng: Random generator used for the jitter
+        
+    Returns:
+        Delay in seconds, never longer than the remaining time
+    """
+    growth = 1.5 ** min(attempt, _MAX_POLL_GROWTH_STEPS)
+    ceiling = min(_FIRST_POLL_DELAY * growth, poll_interval)
+    return max(0.0, min(rng.uniform(ceiling / 2, ceiling), remaining))
+
+
+def _connection_error(
+    logger: logging.Logger, context: str, error: Exception
+) -> ConnectionError:
+    """Log a transport failure and wrap it in a ConnectionError.
+    
+    Args:
+        logger: Logger to report the failure on
+        context: Context string for logging
+        error: Exception raised by the HTTP library
+    
+    Returns:
+        ConnectionError for the caller to raise
+    """
+    message = f"Connection error during {context}: {str(error)}"
+    logger.error(message)
+    return ConnectionError(message)
+
+
+def _unwrap_payload(data: Any, logger: logging.Logger) -> Dict[str, Any]:
+    """Extract the payload from a successful API response envelope.
+    
+    Args:
+        data: Decoded JSON body of a 200 response
+        logger: Logger to report API-level errors on
+    
+    Returns:
+        Contents of the envelope's ``data`` field
+    
+    Raises:
+        BridgeIQError: If the envelope does not report success
+    """
+    if data.get("status") == "success":
+        return data.get("data") or {}
+    
+    # Handle API-level error in 200 response
+    message = data.get("message", "Unknown error")
+    logger.error("API returned error: %s", message)
+    raise BridgeIQError(message, data)
+
+
+def _lite_status(data: Dict[str, Any], logger: logging.Logger) -> StatusLite:
+    """Build a lightweight status from a status response payload.
+    
+    Args:
+        data: Payload of a successful status response
+        logger: Logger to report a malformed payload on
+    
+    Returns:
+        Status with only the fields needed for polling
+    
+    Raises:
+        BridgeIQError: If the payload lacks a required field
+    """
+    try:
+        return StatusLite.from_data(data)
+    except KeyError as e:
+        message = f"Status response is missing field {e}"
+        logger.error(message)
+        raise BridgeIQError(message, data) from e
+
+def _health_from_response(response: Any, logger: logging.Logger) -> bool:
+    """Interpret a health check response.
+    
+    Works for both requests and httpx responses.
+    
+    Args:
+        response: Response from the health check endpoint
+        logger: Logger to report the result on
+    
+    Returns:
+        True if the API is healthy, False otherwise
+    """
+    if response.status_code == 200:
+        try:
+            data = parse_json(response)
+            # Check if the response has a 'status' field
+            if isinstance(data, dict) and 'status' in data:
+                is_healthy = bool(data.get("status", False))
+            else:
+                # If no status field or data is not a dict, check if data itself is a boolean
+                is_healthy = bool(data) if data is not None else False
+    
+            logger.info("API health check result: %s", is_healthy)
+            return is_healthy
+        except (ValueError, KeyError, TypeError):
+            logger.warning(
+                "API health check returned unexpected response format: %s",
+                body_text(response),
+            )
+            return False
+    
+    # In case of 404, the endpoint might not be implemented yet
+    if response.status_code == 404:
+        logger.warning(
+            "Health check endpoint not found. API might still be functional."
+        )
+        # Return True as this is an expected response
+        return True
+    
+    logger.warning(
+        "API health check failed with status code %s", response.status_code
+    )
+    return False
+
+
+def _revalidation_headers(
+    cache: "OrderedDict[str, _CachedStatus]",
+    request_id: str,
+) -> Dict[str, str]:
+    """Build conditional request headers for a cached status.
+    
+    Args:
+        cache: Per-client status cache
+        request_id: The analysis request ID
+        
+    Returns:
+        If-None-Match/If-Modified-Since headers, empty if nothing is cached
+    """
+    entry = cache.get(request_id)
+    if entry is None:
+        return {}
+    
+    etag, last_modified, _ = entry
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _cache_status(
+    cache: "OrderedDict[str, _CachedStatus]",
+    request_id: str,
+    response: Any,
+    status: AnalysisStatus,
+) -> None:
+    """Remember a status so the next check can be made conditional.
+    
+    Only statuses that can still change are kept; a finished analysis is
+    dropped so it is never served from the cache.
+    
+    Args:
+        cache: Per-client status cache
+        request_id: The analysis request ID
+        response: Response the status was parsed from
+        status: The parsed status
+    """
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not status.is_processing or not (etag or last_modified):
+        cache.pop(request_id, None)
+        return
+    
+    cache[request_id] = (etag, last_modified, status)
+    cache.move_to_end(request_id)
+    if len(cache) > _STATUS_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _read_etag(output_file: Path, url: str) -> Optional[str]:
+    """Read the ETag stored alongside a previously downloaded file.
+    
+    Args:
+        output_file: Path of the downloaded file
+        url: Report URL being downloaded to the file
+        
+    Returns:
+        Stored ETag, or None if the file or its ETag is missing or the
+        ETag was stored for a different URL
+    """
+    etag_file = output_file.with_name(output_file.name + ".etag")
+    if not output_file.is_file() or not etag_file.is_file():
+        return None
+    try:
+        stored = json.loads(etag_file.read_text())
+    except ValueError:
+        return None
+    if not isinstance(stored, dict) or stored.get("url") != url:
+        return None
+    return stored.get("etag") or None
+
+
+def _write_etag(output_file: Path, url: str, etag: Optional[str]) -> None:
+    """Store the ETag of a downloaded file, and the URL it came from, next to it.
+    
+    Args:
+        output_file: Path of the downloaded file
+        url: Report URL the file was downloaded from
+        etag: ETag header of the response; a stale ETag is removed if None
+    """
+    etag_file = output_file.with_name(output_file.name + ".etag")
+    if etag:
+        etag_file.write_text(json.dumps({"url": url, "etag": etag}))
+    elif etag_file.exists():
+        etag_file.unlink()
 
 
 class BridgeIQClient:
@@ -53,6 +447,8 @@ class BridgeIQClient:
         timeout: int = 120,
         max_retries: int = 3,
         logger: Optional[logging.Logger] = None,
+        health_cache_ttl: float = 10.0,
+        compress_uploads: bool = False,
     ):
         """Initialize the BridgeIQ client.
         
@@ -65,6 +461,9 @@ class BridgeIQClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             logger: Optional custom logger instance
+            health_cache_ttl: Seconds to reuse a health check result (0 disables)
+            compress_uploads: Gzip uploads of uncompressed DICOM images; only
+                enable this if the server accepts Content-Encoding: gzip
         """
         # API credentials and settings
         self.client_id = client_id
@@ -72,6 +471,14 @@ class BridgeIQClient:
         self.device_path = device_path
         self.base_url = base_url
         
+        # Endpoint URLs are fixed for the client's lifetime, so resolve
+        # them once rather than on every request
+        _check_base_url(base_url)
+        self._health_url = urljoin(base_url, "/api/v1/utils/health-check/")
+        self._requests_url = urljoin(
+            base_url, f"/api/v1/webhooks/devices/{device_path}/requests"
+        )
+        
         # Convert string to Environment enum if needed
         if isinstance(environment, str):
             self.environment = Environment.from_string(environment)
@@ -79,6 +486,10 @@ class BridgeIQClient:
             self.environment = environment
             
         self.timeout = timeout
+        self.health_cache_ttl = health_cache_ttl
+        self.compress_uploads = compress_uploads
+        self._health_cache: Tuple[float, bool] = (float("-inf"), False)
+        self._status_cache: "OrderedDict[str, _CachedStatus]" = OrderedDict()
         
         # Configure logging
         self.logger = logger or get_logger()
@@ -91,16 +502,29 @@ class BridgeIQClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
-        self.session.mount("http://", HTTPAdapter(max_retries=retry_strategy))
-        self.session.mount("https://", HTTPAdapter(max_retries=retry_strategy))
+        # A larger pool keeps connections alive across overlapping polls
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=32,
+            pool_block=False,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         
         # Set default headers
         self.user_agent = get_user_agent()
+        self._headers = {
+            "User-Agent": self.user_agent,
+            "client-id": self.client_id,
+            "client-secret": self.client_secret,
+        }
+        self.session.headers.update(self._headers)
         
         # Log initialization
         self.logger.info(
-            f"BridgeIQ client initialized for device {device_path} "
-            f"in {self.environment.value} environment using {base_url}"
+            "BridgeIQ client initialized for device %s in %s environment using %s",
+            device_path, self.environment.value, base_url,
         )
         
     def __enter__(self):
@@ -120,136 +544,108 @@ class BridgeIQClient:
         """Get headers for API requests.
         
         Returns:
-            Headers dictionary with authentication and user agent
+            Shared headers dictionary with authentication and user agent;
+            callers must not mutate it
         """
-        return {
-            "User-Agent": self.user_agent,
-            "client-id": self.client_id,
-            "client-secret": self.client_secret,
-        }
+        return self._headers
     
-    def _handle_error_response(
-        self, response: requests.Response, context: str = ""
-    ) -> None:
-        """Handle error responses from the API.
+    def _request(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        *,
+        authenticated: bool = True,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request on the pooled session.
         
         Args:
-            response: Response object from failed request
+            method: Lowercase HTTP method name, e.g. "get"
+            url: Absolute request URL
             context: Context string for logging
+            authenticated: Whether to send the client credentials
+            **kwargs: Extra arguments passed to the session request
+            
+        Returns:
+            Response object; the status code is not checked
             
         Raises:
-            Appropriate exception based on response status and content
+            ConnectionError: If the API request fails due to connection issues
         """
+        if not authenticated:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **_NO_AUTH_HEADERS}
+        
         try:
-            data = response.json()
-            message = data.get("message", "Unknown error")
-        except (ValueError, KeyError):
-            message = response.text or "Unknown error"
-            data = {"message": message}
+            return getattr(self.session, method)(
+                url=url, timeout=self.timeout, **kwargs
+            )
+        except requests.RequestException as e:
+            raise _connection_error(self.logger, context, e) from e
+    
+    def _request_json(
+        self, method: str, url: str, context: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Send a request and unwrap the JSON payload of the response.
+        
+        Args:
+            method: Lowercase HTTP method name, e.g. "get"
+            url: Absolute request URL
+            context: Context string for logging
+            **kwargs: Extra arguments passed to the session request
             
-        # Log the error response
-        self.logger.error(
-            f"API error ({response.status_code}) during {context}: {message}"
-        )
+        Returns:
+            Contents of the response envelope's ``data`` field
+            
+        Raises:
+            ConnectionError: If the API request fails due to connection issues
+            BridgeIQError: Or a subclass, for API errors
+        """
+        response = self._request(method, url, context, **kwargs)
+        if response.status_code == 200:
+            return _unwrap_payload(parse_json(response), self.logger)
         
-        # Raise appropriate exception based on status code
-        if response.status_code == 401:
-            raise AuthenticationError(
-                f"Authentication failed: {message}", data, response.status_code
-            )
-        elif response.status_code == 402:
-            raise InsufficientTokensError(
-                f"Insufficient tokens: {message}", data, response.status_code
-            )
-        elif response.status_code == 404:
-            raise ResourceNotFoundError(
-                f"Resource not found: {message}", data, response.status_code
-            )
-        elif response.status_code == 400:
-            raise ValidationError(
-                f"Validation error: {message}", 
-                field=None, 
-                response=data, 
-                status_code=response.status_code
-            )
-        elif response.status_code in (408, 504):
-            raise TimeoutError(
-                f"Request timed out: {message}", data, response.status_code
-            )
-        elif response.status_code in range(500, 600):
-            # Server errors
-            raise BridgeIQError(
-                f"Server error ({response.status_code}): {message}", 
-                data, 
-                response.status_code
-            )
-        else:
-            # General error catch-all
-            raise BridgeIQError(
-                f"API error ({response.status_code}): {message}", 
-                data, 
-                response.status_code
-            )
+        # Handle error responses
+        raise_for_response(response, self.logger, context)
     
     def health_check(self) -> bool:
         """Check if the API is available and functioning.
         
+        Results are reused for ``health_cache_ttl`` seconds to avoid a
+        round-trip on every call.
+        
         Returns:
             True if the API is healthy, False otherwise
             
         Raises:
             ConnectionError: If the API request fails due to connection issues
         """
-        self.logger.info("Checking API health")
-        
-        # Prepare request
-        url = urljoin(self.base_url, "/api/v1/utils/health-check/")
-        headers = self._get_headers()
+        checked_at, is_healthy = self._health_cache
+        if time.monotonic() - checked_at < self.health_cache_ttl:
+            self.logger.debug("Using cached API health check result: %s", is_healthy)
+            return is_healthy
+        
+        is_healthy = self._check_health()
+        self._health_cache = (time.monotonic(), is_healthy)
+        return is_healthy
+    
+    def invalidate_health_cache(self) -> None:
+        """Force the next health_check() call to query the API."""
+        self._health_cache = (float("-inf"), False)
+    
+    def _check_health(self) -> bool:
+        """Query the API health endpoint.
         
-        try:
-            # Send request
-            response = self.session.get(
-                url=url,
-                headers=headers,
-                timeout=self.timeout,
-            )
+        Returns:
+            True if the API is healthy, False otherwise
             
-            # Parse response
-            if response.ok:
-                try:
-                    data = response.json()
-                    # Check if the response has a 'status' field
-                    if isinstance(data, dict) and 'status' in data:
-                        is_healthy = bool(data.get("status", False))
-                    else:
-                        # If no status field or data is not a dict, check if data itself is a boolean
-                        is_healthy = bool(data) if data is not None else False
-                    
-                    self.logger.info(f"API health check result: {is_healthy}")
-                    return is_healthy
-                except (ValueError, KeyError, TypeError):
-                    self.logger.warning(
-                        f"API health check returned unexpected response format: {response.text}"
-                    )
-                    return False
-            else:
-                # In case of 404, the endpoint might not be implemented yet
-                if response.status_code == 404:
-                    self.logger.warning(
-                        "Health check endpoint not found. API might still be functional."
-                    )
-                    # Return True as this is an expected response
-                    return True
-                    
-                self.logger.warning(
-                    f"API health check failed with status code {response.status_code}"
-                )
-                return False
-                
-        except requests.RequestException as e:
-            message = f"Connection error during health check: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+        Raises:
+            ConnectionError: If the API request fails due to connection issues
+        """
+        self.logger.info("Checking API health")
+        
+        response = self._request("get", self._health_url, "health check")
+        return _health_from_response(response, self.logger)
     
     def send_analysis(
         self,
@@ -286,94 +682,94 @@ class BridgeIQClient:
             BridgeIQError: For other API errors
         """
         # Prepare and validate image data
-        if isinstance(image_path, (str, Path)):
-            self.logger.info(f"Reading image from {image_path}")
-            image_data = get_file_content(image_path)
-            image_filename = os.path.basename(str(image_path))
-        else:
-            self.logger.info("Using provided image data")
-            image_data = image_path
-            image_filename = "image.dcm"
+        image_filename, image_size, image_data = _prepare_image(
+            image_path, self.logger
+        )
+        # Only close files opened here, never caller-provided data
+        image_file = image_data if image_data is not image_path else None
         
         # Prepare form data
         form_data = {
-            "image": (image_filename, image_data),
-            "report_type": (None, report_type),
+            "report_type": report_type,
         }
         
         # Add optional parameters if provided
         if radiography_type:
-            form_data["radiography_type"] = (None, radiography_type)
+            form_data["radiography_type"] = radiography_type
         if patient_id:
-            form_data["patient_id"] = (None, patient_id)
+            form_data["patient_id"] = patient_id
         if patient_name:
-            form_data["patient_name"] = (None, patient_name)
+            form_data["patient_name"] = patient_name
         if patient_gender:
-            form_data["patient_gender"] = (None, patient_gender)
+            form_data["patient_gender"] = patient_gender
         if patient_dob:
-            form_data["patient_dob"] = (None, patient_dob)
+            form_data["patient_dob"] = patient_dob
         if callback_url:
-            form_data["callback_url"] = (None, callback_url)
-        
-        # Prepare request
-        url = urljoin(
-            self.base_url, f"/api/v1/webhooks/devices/{self.device_path}/requests"
-        )
+            form_data["callback_url"] = callback_url
         
         # Set headers with authentication credentials
-        headers = {
-            "User-Agent": self.user_agent,
-            "client-id": self.client_id,
-            "client-secret": self.client_secret,
-        }
+        headers = self._get_headers()
+        
+        compressed = None
+        if self.compress_uploads:
+            compressed = _gzip_upload(form_data, image_filename, image_data, image_size)
+        
+        if compressed is not None:
+            body, content_type = compressed
+            self.logger.debug("Compressed upload to %d bytes", len(body))
+            request_kwargs = {
+                "data": body,
+                "headers": {
+                    **headers,
+                    "Content-Type": content_type,
+                    "Content-Encoding": "gzip",
+                },
+            }
+        elif image_size > _STREAM_UPLOAD_THRESHOLD:
+            # requests encodes files= uploads in memory, so send large images
+            # as a body that reads the image while the socket drains it
+            body = MultipartStream(
+                form_data, "image", image_filename, image_data, image_size
+            )
+            request_kwargs = {
+                "data": body,
+                "headers": {**headers, "Content-Type": body.content_type},
+            }
+        else:
+            files = {"image": (image_filename, image_data)}
+            files.update((name, (None, value)) for name, value in form_data.items())
+            request_kwargs = {"files": files, "headers": headers}
         
         self.logger.info(
-            f"Sending analysis request for {image_filename}"
-            + (f" (type: {radiography_type})" if radiography_type else "")
+            "Sending analysis request for %s (%d bytes, type: %s)",
+            image_filename, image_size, radiography_type or "default",
         )
         
         try:
-            # Send request
-            response = self.session.post(
-                url=url,
-                files=form_data,
-                headers=headers,
-                timeout=self.timeout,
+            data = self._request_json(
+                "post", self._requests_url, "analysis request", **request_kwargs
             )
-            
-            # Handle successful response
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check for success status in JSON response
-                if data.get("status") == "success":
-                    self.logger.info(
-                        f"Analysis request submitted successfully: "
-                        f"{data.get('data', {}).get('request_id')}"
-                    )
-                    return AnalysisRequest(**data.get("data", {}))
-                else:
-                    # Handle API-level error in 200 response
-                    message = data.get("message", "Unknown error")
-                    self.logger.error(f"API returned error: {message}")
-                    raise BridgeIQError(message, data)
-            
-            # Handle error responses
-            self._handle_error_response(response, "analysis request")
-            
-        except requests.RequestException as e:
-            message = f"Connection error during analysis request: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+        finally:
+            if image_file is not None:
+                image_file.close()
+        
+        result = AnalysisRequest.model_validate(data)
+        self.logger.info("Analysis request submitted successfully: %s", result.request_id)
+        return result
     
-    def check_status(self, request_id: Union[str, UUID]) -> AnalysisStatus:
+    def check_status(
+        self, request_id: Union[str, UUID], lightweight: bool = False
+    ) -> Union[AnalysisStatus, StatusLite]:
         """Check the status of an analysis request.
         
         Args:
             request_id: The analysis request ID
+            lightweight: Return a StatusLite built without model validation
+                instead of a full AnalysisStatus
             
         Returns:
-            AnalysisStatus object with status information
+            AnalysisStatus object with status information, or StatusLite
+            if lightweight is set
             
         Raises:
             ConnectionError: If the API request fails due to connection issues
@@ -387,45 +783,31 @@ class BridgeIQClient:
             request_id = str(request_id)
         
         # Prepare request
-        url = urljoin(
-            self.base_url, 
-            f"/api/v1/webhooks/devices/{self.device_path}/requests/{request_id}"
-        )
-        headers = self._get_headers()
+        url = f"{self._requests_url}/{request_id}"
         
-        self.logger.info(f"Checking status for analysis request {request_id}")
+        self.logger.info("Checking status for analysis request %s", request_id)
         
-        try:
-            # Send request
-            response = self.session.get(
-                url=url,
-                headers=headers,
-                timeout=self.timeout,
-            )
-            
-            # Handle successful response
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check for success status in JSON response
-                if data.get("status") == "success":
-                    self.logger.info(
-                        f"Analysis status: {data.get('data', {}).get('analysis_status')}"
-                    )
-                    return AnalysisStatus(**data.get("data", {}))
-                else:
-                    # Handle API-level error in 200 response
-                    message = data.get("message", "Unknown error")
-                    self.logger.error(f"API returned error: {message}")
-                    raise BridgeIQError(message, data)
-            
-            # Handle error responses
-            self._handle_error_response(response, "status check")
-            
-        except requests.RequestException as e:
-            message = f"Connection error during status check: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+        # Revalidate a cached in-progress status instead of refetching it
+        headers = {} if lightweight else _revalidation_headers(self._status_cache, request_id)
+        response = self._request("get", url, "status check", headers=headers)
+        if response.status_code == 304 and request_id in self._status_cache:
+            status = self._status_cache[request_id][2]
+            self.logger.info("Analysis status unchanged: %s", status.analysis_status)
+            return status
+        
+        # Handle error responses
+        if response.status_code != 200:
+            raise_for_response(response, self.logger, "status check")
+        
+        data = _unwrap_payload(parse_json(response), self.logger)
+        if lightweight:
+            status = _lite_status(data, self.logger)
+        else:
+            status = AnalysisStatus.model_validate(data)
+            _cache_status(self._status_cache, request_id, response, status)
+        
+        self.logger.info("Analysis status: %s", status.analysis_status)
+        return status
     
     def wait_for_completion(
         self, 
@@ -435,10 +817,14 @@ class BridgeIQClient:
     ) -> AnalysisStatus:
         """Wait for an analysis to complete.
         
+        Status checks start 250 ms apart and back off, with jitter, to at
+        most poll_interval, so quick analyses are noticed without polling
+        long ones at a high rate.
+        
         Args:
             request_id: The analysis request ID
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Longest time between status checks in seconds
             
         Returns:
             Final AnalysisStatus object
@@ -447,34 +833,46 @@ class BridgeIQClient:
             TimeoutError: If the analysis doesn't complete within the timeout
             Same exceptions as check_status()
         """
-        start_time = time.time()
+        # Normalize request_id once rather than on every poll
+        if isinstance(request_id, UUID):
+            request_id = str(request_id)
+        
+        start_time = time.monotonic()
         end_time = start_time + timeout
         
         self.logger.info(
-            f"Waiting for analysis {request_id} to complete "
-            f"(timeout: {timeout}s, poll interval: {poll_interval}s)"
+            "Waiting for analysis %s to complete (timeout: %ss, poll interval: %ss)",
+            request_id, timeout, poll_interval,
         )
         
-        while time.time() < end_time:
+        rng = random.Random()
+        attempt = 0
+        
+        while time.monotonic() < end_time:
             # Check status
             status = self.check_status(request_id)
             
             # If completed or failed, return status
             if status.is_completed or status.is_failed:
                 self.logger.info(
-                    f"Analysis {request_id} finished with status: {status.analysis_status}"
+                    "Analysis %s finished with status: %s",
+                    request_id, status.analysis_status,
                 )
                 return status
             
-            # If still processing, wait and try again
+            # If still processing, back off and try again
+            delay = _poll_delay(
+                attempt, poll_interval, end_time - time.monotonic(), rng
+            )
+            attempt += 1
             self.logger.debug(
-                f"Analysis {request_id} still processing. "
-                f"Waiting {poll_interval} seconds..."
+                "Analysis %s still processing. Waiting %.1f seconds...",
+                request_id, delay,
             )
-            time.sleep(poll_interval)
+            time.sleep(delay)
         
         # If we get here, the timeout was reached
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
         message = f"Timeout waiting for analysis to complete ({elapsed:.1f}s elapsed)"
         self.logger.error(message)
         raise TimeoutError(message)
@@ -483,12 +881,20 @@ class BridgeIQClient:
         self, 
         report_url: str,
         output_path: Union[str, Path],
+        revalidate: bool = False,
     ) -> Path:
         """Download a PDF report.
         
+        With revalidate, the response's ETag and the report URL are stored
+        in a ``<output_path>.etag`` file next to the PDF, so downloading the
+        same URL to the same path again skips the body if the report has
+        not changed.
+        
         Args:
             report_url: URL to the PDF report
             output_path: Path where the PDF should be saved
+            revalidate: Whether to keep an ETag file next to the PDF and
+                skip unchanged downloads
             
         Returns:
             Path to the saved PDF file
@@ -498,7 +904,7 @@ class BridgeIQClient:
             ResourceNotFoundError: If the report doesn't exist
             BridgeIQError: For other API errors
         """
-        self.logger.info(f"Downloading report from {report_url}")
+        self.logger.info("Downloading report from %s", report_url)
         
         # Determine if we need to use a full URL or just the path
         if report_url.startswith("http"):
@@ -507,27 +913,50 @@ class BridgeIQClient:
             # If it's a path, join with base URL
             url = urljoin(self.base_url, report_url.lstrip("/"))
         
-        try:
-            # Send request
-            response = self.session.get(
-                url=url,
-                timeout=self.timeout,
-            )
-            
-            # Handle successful response
-            if response.status_code == 200:
-                # Save the PDF
-                output_file = save_file(response.content, output_path)
-                self.logger.info(f"Report saved to {output_file}")
+        # PDFs are already compressed, so ask for the raw bytes rather than
+        # a gzip stream that would be decoded again on the way to disk
+        headers = {"Accept-Encoding": "identity"}
+        
+        # Revalidate an earlier download of the same report instead of
+        # fetching the whole file again
+        output_file = Path(output_path)
+        etag = _read_etag(output_file, url) if revalidate else None
+        if etag:
+            headers["If-None-Match"] = etag
+        
+        # Send request without the session's credentials, since report
+        # links may point outside the API host
+        response = self._request(
+            "get", url, "report download",
+            authenticated=False, headers=headers, stream=True,
+        )
+        with response:
+            if response.status_code == 304:
+                self.logger.info("Report unchanged, keeping %s", output_file)
                 return output_file
             
             # Handle error responses
-            self._handle_error_response(response, "report download")
+            if response.status_code != 200:
+                raise_for_response(response, self.logger, "report download")
             
-        except requests.RequestException as e:
-            message = f"Connection error during report download: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+            # Stream the PDF to disk; the file is replaced only once complete
+            try:
+                save_stream(
+                    response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE),
+                    output_file,
+                )
+            except requests.RequestException as e:
+                raise _connection_error(self.logger, "report download", e) from e
+            
+            # Only record the ETag once the new report is in place; an ETag
+            # left by an earlier download no longer matches the file
+            _write_etag(
+                output_file, url,
+                response.headers.get("ETag") if revalidate else None,
+            )
+        
+        self.logger.info("Report saved to %s", output_file)
+        return output_file
 
 
 class AsyncBridgeIQClient:
@@ -548,6 +977,9 @@ class AsyncBridgeIQClient:
         timeout: int = 120,
         max_retries: int = 3,
         logger: Optional[logging.Logger] = None,
+        health_cache_ttl: float = 10.0,
+        share_client: bool = False,
+        compress_uploads: bool = False,
     ):
         """Initialize the async BridgeIQ client.
         
@@ -560,6 +992,11 @@ class AsyncBridgeIQClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             logger: Optional custom logger instance
+            health_cache_ttl: Seconds to reuse a health check result (0 disables)
+            share_client: Reuse one connection pool per base URL and event
+                loop across client instances instead of owning a pool
+            compress_uploads: Gzip uploads of uncompressed DICOM images; only
+                enable this if the server accepts Content-Encoding: gzip
         """
         # API credentials and settings
         self.client_id = client_id
@@ -567,6 +1004,14 @@ class AsyncBridgeIQClient:
         self.device_path = device_path
         self.base_url = base_url
         
+        # Endpoint URLs are fixed for the client's lifetime, so resolve
+        # them once rather than on every request
+        _check_base_url(base_url)
+        self._health_url = urljoin(base_url, "/api/v1/utils/health-check/")
+        self._requests_url = urljoin(
+            base_url, f"/api/v1/webhooks/devices/{device_path}/requests"
+        )
+        
         # Convert string to Environment enum if needed
         if isinstance(environment, str):
             self.environment = Environment.from_string(environment)
@@ -574,27 +1019,42 @@ class AsyncBridgeIQClient:
             self.environment = environment
             
         self.timeout = timeout
+        self.health_cache_ttl = health_cache_ttl
+        self.compress_uploads = compress_uploads
+        self._health_cache: Tuple[float, bool] = (float("-inf"), False)
+        self._status_cache: "OrderedDict[str, _CachedStatus]" = OrderedDict()
         self.max_retries = max_retries
         
+        # Created on first use so it binds to the running event loop
+        self._health_lock: Optional[asyncio.Lock] = None
+        
         # Configure logging
         self.logger = logger or get_logger()
         
         # Set default headers
         self.user_agent = get_user_agent()
+        self._headers = {
+            "User-Agent": self.user_agent,
+            "client-id": self.client_id,
+            "client-secret": self.client_secret,
+        }
         
-        # Client will be created in an async context
-        self.client = None
+        # One pooled client is shared by every request made by this
+        # instance; call close() (or use ``async with``) to release it.
+        # Shared pools are looked up per request from the running loop.
+        self.share_client = share_client
+        self.client = None if share_client else self._create_client()
         
         # Log initialization
         self.logger.info(
-            f"Async BridgeIQ client initialized for device {device_path} "
-            f"in {self.environment.value} environment using {base_url}"
+            "Async BridgeIQ client initialized for device %s in %s environment "
+            "using %s",
+            device_path, self.environment.value, base_url,
         )
     
     async def __aenter__(self):
         """Support async context manager interface."""
-        if self.client is None:
-            self.client = httpx.AsyncClient(timeout=self.timeout)
+        await self._get_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -602,7 +1062,10 @@ class AsyncBridgeIQClient:
         await self.close()
     
     async def close(self) -> None:
-        """Close the async client session."""
+        """Close the async client session.
+        
+        Shared connection pools stay open; see close_shared_clients().
+        """
         if self.client:
             await self.client.aclose()
             self.client = None
@@ -612,149 +1075,203 @@ class AsyncBridgeIQClient:
         """Get headers for API requests.
         
         Returns:
-            Headers dictionary with authentication and user agent
+            Shared headers dictionary with authentication and user agent;
+            callers must not mutate it
         """
-        return {
-            "User-Agent": self.user_agent,
-            "client-id": self.client_id,
-            "client-secret": self.client_secret,
-        }
+        return self._headers
+    
+    @staticmethod
+    async def close_shared_clients() -> None:
+        """Close the shared connection pools of the running event loop.
+        
+        Call this before the loop shuts down when using share_client=True.
+        """
+        await close_shared_clients()
+    
+    def _create_client(self) -> "httpx.AsyncClient":
+        """Create the pooled async HTTP client.
+        
+        HTTP/2 is enabled when h2 is installed, so concurrent requests
+        share one connection; servers that only speak HTTP/1.1 are still
+        supported through ALPN negotiation.
+        
+        Returns:
+            Async HTTP client with authentication headers preset, or
+            without credentials if it is shared between instances
+        """
+        import httpx
+        
+        if self.share_client:
+            # Over HTTP/2 each connection multiplexes many requests, so a
+            # few sockets serve every instance sharing the pool
+            if _HTTP2_AVAILABLE:
+                limits = httpx.Limits(
+                    max_keepalive_connections=4,
+                    max_connections=16,
+                    keepalive_expiry=30,
+                )
+            else:
+                limits = httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30,
+                )
+            return httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE, timeout=self.timeout, limits=limits
+            )
+        
+        # A single instance's concurrent uploads and polls also fit on a
+        # few multiplexed connections when HTTP/2 is available
+        if _HTTP2_AVAILABLE:
+            limits = httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                keepalive_expiry=30,
+            )
+        else:
+            limits = httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=30,
+            )
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=self.timeout,
+            limits=limits,
+            headers=self._get_headers(),
+        )
     
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the async HTTP client.
+    async def _get_client(self) -> "httpx.AsyncClient":
+        """Get the async HTTP client, recreating it after close().
         
         Returns:
             Async HTTP client
         """
+        if self.share_client:
+            return get_shared_client(self.base_url, self._create_client)
         if self.client is None:
-            self.client = httpx.AsyncClient(timeout=self.timeout)
+            self.client = self._create_client()
         return self.client
     
-    async def _handle_error_response(
-        self, response: httpx.Response, context: str = ""
-    ) -> None:
-        """Handle error responses from the API.
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        context: str,
+        *,
+        authenticated: bool = True,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """Send a request on the pooled async client.
         
         Args:
-            response: Response object from failed request
+            method: HTTP method name, e.g. "GET"
+            url: Absolute request URL
             context: Context string for logging
+            authenticated: Whether to send the client credentials
+            stream: Return before reading the body; the caller must close
+                the response
+            **kwargs: Extra arguments passed to ``build_request``
+            
+        Returns:
+            Response object; the status code is not checked
             
         Raises:
-            Appropriate exception based on response status and content
+            ConnectionError: If the API request fails due to connection issues
         """
+        import httpx
+        
+        # Get client
+        client = await self._get_client()
+        
+        # Shared pools carry no credentials of their own; reuse the cached
+        # headers as-is unless the call adds its own
+        if self.share_client:
+            extra = kwargs.get("headers")
+            kwargs["headers"] = {**self._headers, **extra} if extra else self._headers
+        
+        request = client.build_request(method, url, timeout=self.timeout, **kwargs)
+        if not authenticated:
+            for name in _NO_AUTH_HEADERS:
+                request.headers.pop(name, None)
+        
         try:
-            data = response.json()
-            message = data.get("message", "Unknown error")
-        except (ValueError, KeyError):
-            message = response.text or "Unknown error"
-            data = {"message": message}
+            return await client.send(request, stream=stream)
+        except httpx.RequestError as e:
+            raise _connection_error(self.logger, context, e) from e
+    
+    async def _request_json(
+        self, method: str, url: str, context: str, **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Send a request and unwrap the JSON payload of the response.
+        
+        Args:
+            method: HTTP method name, e.g. "GET"
+            url: Absolute request URL
+            context: Context string for logging
+            **kwargs: Extra arguments passed to ``build_request``
             
-        # Log the error response
-        self.logger.error(
-            f"API error ({response.status_code}) during {context}: {message}"
-        )
+        Returns:
+            Contents of the response envelope's ``data`` field
+            
+        Raises:
+            ConnectionError: If the API request fails due to connection issues
+            BridgeIQError: Or a subclass, for API errors
+        """
+        response = await self._request(method, url, context, **kwargs)
+        if response.status_code == 200:
+            return _unwrap_payload(parse_json(response), self.logger)
         
-        # Raise appropriate exception based on status code
-        if response.status_code == 401:
-            raise AuthenticationError(
-                f"Authentication failed: {message}", data, response.status_code
-            )
-        elif response.status_code == 402:
-            raise InsufficientTokensError(
-                f"Insufficient tokens: {message}", data, response.status_code
-            )
-        elif response.status_code == 404:
-            raise ResourceNotFoundError(
-                f"Resource not found: {message}", data, response.status_code
-            )
-        elif response.status_code == 400:
-            raise ValidationError(
-                f"Validation error: {message}", 
-                field=None, 
-                response=data, 
-                status_code=response.status_code
-            )
-        elif response.status_code in (408, 504):
-            raise TimeoutError(
-                f"Request timed out: {message}", data, response.status_code
-            )
-        elif response.status_code in range(500, 600):
-            # Server errors
-            raise BridgeIQError(
-                f"Server error ({response.status_code}): {message}", 
-                data, 
-                response.status_code
-            )
-        else:
-            # General error catch-all
-            raise BridgeIQError(
-                f"API error ({response.status_code}): {message}", 
-                data, 
-                response.status_code
-            )
+        # Handle error responses
+        raise_for_response(response, self.logger, context)
     
     async def health_check(self) -> bool:
         """Check if the API is available and functioning asynchronously.
         
+        Results are reused for ``health_cache_ttl`` seconds, and concurrent
+        callers share a single in-flight request.
+        
         Returns:
             True if the API is healthy, False otherwise
             
         Raises:
             ConnectionError: If the API request fails due to connection issues
         """
-        self.logger.info("Checking API health asynchronously")
-        
-        # Prepare request
-        url = urljoin(self.base_url, "/api/v1/utils/health-check/")
-        headers = self._get_headers()
-        
-        # Get client
-        client = await self._get_client()
+        if self._health_lock is None:
+            self._health_lock = asyncio.Lock()
+        
+        async with self._health_lock:
+            checked_at, is_healthy = self._health_cache
+            if time.monotonic() - checked_at < self.health_cache_ttl:
+                self.logger.debug(
+                    "Using cached async API health check result: %s", is_healthy
+                )
+                return is_healthy
+            
+            is_healthy = await self._check_health()
+            self._health_cache = (time.monotonic(), is_healthy)
+            return is_healthy
+    
+    def invalidate_health_cache(self) -> None:
+        """Force the next health_check() call to query the API."""
+        self._health_cache = (float("-inf"), False)
+    
+    async def _check_health(self) -> bool:
+        """Query the API health endpoint asynchronously.
         
-        try:
-            # Send request
-            response = await client.get(
-                url=url,
-                headers=headers,
-                timeout=self.timeout,
-            )
+        Returns:
+            True if the API is healthy, False otherwise
             
-            # Parse response
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    # Check if the response has a 'status' field
-                    if isinstance(data, dict) and 'status' in data:
-                        is_healthy = bool(data.get("status", False))
-                    else:
-                        # If no status field or data is not a dict, check if data itself is a boolean
-                        is_healthy = bool(data) if data is not None else False
-                    
-                    self.logger.info(f"Async API health check result: {is_healthy}")
-                    return is_healthy
-                except (ValueError, KeyError, TypeError):
-                    self.logger.warning(
-                        f"Async API health check returned unexpected response format: {response.text}"
-                    )
-                    return False
-            else:
-                # In case of 404, the endpoint might not be implemented yet
-                if response.status_code == 404:
-                    self.logger.warning(
-                        "Health check endpoint not found. API might still be functional."
-                    )
-                    # Return True as this is an expected response
-                    return True
-                    
-                self.logger.warning(
-                    f"Async API health check failed with status code {response.status_code}"
-                )
-                return False
-                
-        except httpx.RequestError as e:
-            message = f"Connection error during async health check: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+        Raises:
+            ConnectionError: If the API request fails due to connection issues
+        """
+        self.logger.info("Checking API health asynchronously")
+        
+        response = await self._request(
+            "GET", self._health_url, "async health check"
+        )
+        return _health_from_response(response, self.logger)
     
     async def send_analysis(
         self,
@@ -790,15 +1307,13 @@ class AsyncBridgeIQClient:
             InsufficientTokensError: If account doesn't have enough tokens
             BridgeIQError: For other API errors
         """
-        # Prepare and validate image data
-        if isinstance(image_path, (str, Path)):
-            self.logger.info(f"Reading image from {image_path}")
-            image_data = get_file_content(image_path)
-            image_filename = os.path.basename(str(image_path))
-        else:
-            self.logger.info("Using provided image data")
-            image_data = image_path
-            image_filename = "image.dcm"
+        # Prepare and validate image data; opening and sizing the file can
+        # block on slow or network filesystems, so keep it off the event loop
+        image_filename, image_size, image_data = await asyncio.to_thread(
+            _prepare_image, image_path, self.logger
+        )
+        # Only close files opened here, never caller-provided data
+        image_file = image_data if image_data is not image_path else None
         
         # Prepare form data
         form_data = {
@@ -819,72 +1334,67 @@ class AsyncBridgeIQClient:
         if callback_url:
             form_data["callback_url"] = callback_url
         
-        # Prepare file data
-        files = {"image": (image_filename, image_data)}
-        
-        # Prepare request
-        url = urljoin(
-            self.base_url, f"/api/v1/webhooks/devices/{self.device_path}/requests"
-        )
+        # Prepare file data; credentials come from the pooled client or
+        # _request(), so no per-call headers need to be normalized
+        compressed = None
+        if self.compress_uploads:
+            # Compression is CPU-bound, so run it off the event loop
+            compressed = await asyncio.to_thread(
+                _gzip_upload, form_data, image_filename, image_data, image_size
+            )
         
-        # Set headers with authentication credentials
-        headers = {
-            "User-Agent": self.user_agent,
-            "client-id": self.client_id,
-            "client-secret": self.client_secret,
-        }
+        if compressed is not None:
+            body, content_type = compressed
+            self.logger.debug("Compressed upload to %d bytes", len(body))
+            request_kwargs = {
+                "content": body,
+                "headers": {"Content-Type": content_type, "Content-Encoding": "gzip"},
+            }
+        elif image_file is not None:
+            body = MultipartStream(
+                form_data, "image", image_filename, image_file, image_size
+            )
+            request_kwargs = {
+                "content": _read_in_thread(body),
+                "headers": {
+                    "Content-Type": body.content_type,
+                    "Content-Length": str(len(body)),
+                },
+            }
+        else:
+            files = {"image": (image_filename, image_data)}
+            request_kwargs = {"files": files, "data": form_data}
         
         self.logger.info(
-            f"Sending analysis request for {image_filename}"
-            + (f" (type: {radiography_type})" if radiography_type else "")
+            "Sending analysis request for %s (%d bytes, type: %s)",
+            image_filename, image_size, radiography_type or "default",
         )
         
-        # Get client
-        client = await self._get_client()
-        
         try:
-            # Send request
-            response = await client.post(
-                url=url,
-                files=files,
-                data=form_data,
-                headers=headers,
-                timeout=self.timeout,
+            data = await self._request_json(
+                "POST", self._requests_url, "analysis request", **request_kwargs
             )
-            
-            # Handle successful response
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check for success status in JSON response
-                if data.get("status") == "success":
-                    self.logger.info(
-                        f"Analysis request submitted successfully: "
-                        f"{data.get('data', {}).get('request_id')}"
-                    )
-                    return AnalysisRequest(**data.get("data", {}))
-                else:
-                    # Handle API-level error in 200 response
-                    message = data.get("message", "Unknown error")
-                    self.logger.error(f"API returned error: {message}")
-                    raise BridgeIQError(message, data)
-            
-            # Handle error responses
-            await self._handle_error_response(response, "analysis request")
-            
-        except httpx.RequestError as e:
-            message = f"Connection error during analysis request: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+        finally:
+            if image_file is not None:
+                image_file.close()
+        
+        result = AnalysisRequest.model_validate(data)
+        self.logger.info("Analysis request submitted successfully: %s", result.request_id)
+        return result
     
-    async def check_status(self, request_id: Union[str, UUID]) -> AnalysisStatus:
+    async def check_status(
+        self, request_id: Union[str, UUID], lightweight: bool = False
+    ) -> Union[AnalysisStatus, StatusLite]:
         """Check the status of an analysis request asynchronously.
         
         Args:
             request_id: The analysis request ID
+            lightweight: Return a StatusLite built without model validation
+                instead of a full AnalysisStatus
             
         Returns:
-            AnalysisStatus object with status information
+            AnalysisStatus object with status information, or StatusLite
+            if lightweight is set
             
         Raises:
             ConnectionError: If the API request fails due to connection issues
@@ -898,48 +1408,31 @@ class AsyncBridgeIQClient:
             request_id = str(request_id)
         
         # Prepare request
-        url = urljoin(
-            self.base_url, 
-            f"/api/v1/webhooks/devices/{self.device_path}/requests/{request_id}"
-        )
-        headers = self._get_headers()
+        url = f"{self._requests_url}/{request_id}"
         
-        self.logger.info(f"Checking status for analysis request {request_id}")
+        self.logger.info("Checking status for analysis request %s", request_id)
         
-        # Get client
-        client = await self._get_client()
+        # Revalidate a cached in-progress status instead of refetching it
+        headers = {} if lightweight else _revalidation_headers(self._status_cache, request_id)
+        response = await self._request("GET", url, "status check", headers=headers)
+        if response.status_code == 304 and request_id in self._status_cache:
+            status = self._status_cache[request_id][2]
+            self.logger.info("Analysis status unchanged: %s", status.analysis_status)
+            return status
         
-        try:
-            # Send request
-            response = await client.get(
-                url=url,
-                headers=headers,
-                timeout=self.timeout,
-            )
-            
-            # Handle successful response
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Check for success status in JSON response
-                if data.get("status") == "success":
-                    self.logger.info(
-                        f"Analysis status: {data.get('data', {}).get('analysis_status')}"
-                    )
-                    return AnalysisStatus(**data.get("data", {}))
-                else:
-                    # Handle API-level error in 200 response
-                    message = data.get("message", "Unknown error")
-                    self.logger.error(f"API returned error: {message}")
-                    raise BridgeIQError(message, data)
-            
-            # Handle error responses
-            await self._handle_error_response(response, "status check")
-            
-        except httpx.RequestError as e:
-            message = f"Connection error during status check: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e
+        # Handle error responses
+        if response.status_code != 200:
+            raise_for_response(response, self.logger, "status check")
+        
+        data = _unwrap_payload(parse_json(response), self.logger)
+        if lightweight:
+            status = _lite_status(data, self.logger)
+        else:
+            status = AnalysisStatus.model_validate(data)
+            _cache_status(self._status_cache, request_id, response, status)
+        
+        self.logger.info("Analysis status: %s", status.analysis_status)
+        return status
     
     async def wait_for_completion(
         self, 
@@ -949,10 +1442,14 @@ class AsyncBridgeIQClient:
     ) -> AnalysisStatus:
         """Wait for an analysis to complete asynchronously.
         
+        Status checks start 250 ms apart and back off, with jitter, to at
+        most poll_interval, so quick analyses are noticed without polling
+        long ones at a high rate.
+        
         Args:
             request_id: The analysis request ID
             timeout: Maximum time to wait in seconds
-            poll_interval: Time between status checks in seconds
+            poll_interval: Longest time between status checks in seconds
             
         Returns:
             Final AnalysisStatus object
@@ -961,48 +1458,242 @@ class AsyncBridgeIQClient:
             TimeoutError: If the analysis doesn't complete within the timeout
             Same exceptions as check_status()
         """
-        start_time = time.time()
+        # Normalize request_id once rather than on every poll
+        if isinstance(request_id, UUID):
+            request_id = str(request_id)
+        
+        start_time = time.monotonic()
         end_time = start_time + timeout
         
         self.logger.info(
-            f"Waiting for analysis {request_id} to complete "
-            f"(timeout: {timeout}s, poll interval: {poll_interval}s)"
+            "Waiting for analysis %s to complete (timeout: %ss, poll interval: %ss)",
+            request_id, timeout, poll_interval,
         )
         
-        while time.time() < end_time:
+        # wait_for also cancels a status check still in flight at the deadline
+        try:
+            status = await asyncio.wait_for(
+                self._poll_until_finished(request_id, end_time, poll_interval),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            status = None
+        
+        if status is not None:
+            return status
+        
+        # If we get here, the timeout was reached
+        elapsed = time.monotonic() - start_time
+        message = f"Timeout waiting for analysis to complete ({elapsed:.1f}s elapsed)"
+        self.logger.error(message)
+        raise TimeoutError(message)
+    
+    async def _poll_until_finished(
+        self,
+        request_id: Union[str, UUID],
+        end_time: float,
+        poll_interval: int,
+    ) -> Optional[AnalysisStatus]:
+        """Poll an analysis until it finishes or the deadline passes.
+        
+        Args:
+            request_id: The analysis request ID
+            end_time: Deadline on the time.monotonic() clock
+            poll_interval: Longest time between status checks in seconds
+            
+        Returns:
+            Final AnalysisStatus object, or None if the deadline passed
+            
+        Raises:
+            Same exceptions as check_status()
+        """
+        rng = random.Random()
+        attempt = 0
+        
+        while time.monotonic() < end_time:
             # Check status
             status = await self.check_status(request_id)
             
             # If completed or failed, return status
             if status.is_completed or status.is_failed:
                 self.logger.info(
-                    f"Analysis {request_id} finished with status: {status.analysis_status}"
+                    "Analysis %s finished with status: %s",
+                    request_id, status.analysis_status,
                 )
                 return status
             
-            # If still processing, wait and try again
+            # If still processing, back off and try again
+            delay = _poll_delay(
+                attempt, poll_interval, end_time - time.monotonic(), rng
+            )
+            attempt += 1
+            self.logger.debug(
+                "Analysis %s still processing. Waiting %.1f seconds...",
+                request_id, delay,
+            )
+            await asyncio.sleep(delay)
+        
+        return None
+    
+    async def check_status_many(
+        self,
+        request_ids: Iterable[Union[str, UUID]],
+        max_concurrency: int = _MAX_CONCURRENT_STATUS_CHECKS,
+    ) -> List[AnalysisStatus]:
+        """Check the status of several analysis requests concurrently.
+        
+        Args:
+            request_ids: The analysis request IDs
+            max_concurrency: Maximum number of status checks in flight
+            
+        Returns:
+            AnalysisStatus objects in the same order as request_ids
+            
+        Raises:
+            Same exceptions as check_status()
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def check(request_id: Union[str, UUID]) -> AnalysisStatus:
+            async with semaphore:
+                return await self.check_status(request_id)
+        
+        return list(await asyncio.gather(*(check(rid) for rid in request_ids)))
+    
+    async def iter_completed(
+        self,
+        request_ids: Iterable[Union[str, UUID]],
+        timeout: int = 300,
+        poll_interval: int = 5,
+        max_concurrency: int = _MAX_CONCURRENT_STATUS_CHECKS,
+    ) -> AsyncIterator[Tuple[str, AnalysisStatus]]:
+        """Yield analyses as they finish, polling them together.
+        
+        Each round checks all unfinished requests concurrently; finished
+        requests are yielded at the end of the round and not polled again.
+        
+        Example:
+            async for request_id, status in client.iter_completed(ids):
+                if status.has_pdf:
+                    await client.download_report(status.report_pdf_link, ...)
+        
+        Args:
+            request_ids: The analysis request IDs
+            timeout: Maximum time to wait in seconds for all analyses
+            poll_interval: Longest time between polling rounds in seconds
+            max_concurrency: Maximum number of status checks in flight
+            
+        Yields:
+            (request_id, AnalysisStatus) tuples in completion order
+            
+        Raises:
+            TimeoutError: If any analysis doesn't complete within the timeout
+            Same exceptions as check_status()
+        """
+        start_time = time.monotonic()
+        end_time = start_time + timeout
+        
+        pending = list(dict.fromkeys(str(rid) for rid in request_ids))
+        total = len(pending)
+        
+        self.logger.info(
+            "Waiting for %d analyses to complete (timeout: %ss, poll interval: %ss)",
+            total, timeout, poll_interval,
+        )
+        
+        rng = random.Random()
+        attempt = 0
+        
+        while time.monotonic() < end_time:
+            # Check all unfinished requests
+            statuses = await self.check_status_many(pending, max_concurrency)
+            
+            # Keep polling only the requests that are still processing
+            still_pending = []
+            for request_id, status in zip(pending, statuses):
+                if status.is_completed or status.is_failed:
+                    yield request_id, status
+                else:
+                    still_pending.append(request_id)
+            pending = still_pending
+            
+            if not pending:
+                self.logger.info("All %d analyses finished", total)
+                return
+            
+            # Back off before the next round
+            delay = _poll_delay(
+                attempt, poll_interval, end_time - time.monotonic(), rng
+            )
+            attempt += 1
             self.logger.debug(
-                f"Analysis {request_id} still processing. "
-                f"Waiting {poll_interval} seconds..."
+                "%d analyses still processing. Waiting %.1f seconds...",
+                len(pending), delay,
             )
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(delay)
         
         # If we get here, the timeout was reached
-        elapsed = time.time() - start_time
-        message = f"Timeout waiting for analysis to complete ({elapsed:.1f}s elapsed)"
+        elapsed = time.monotonic() - start_time
+        message = (
+            f"Timeout waiting for {len(pending)} of {total} "
+            f"analyses to complete ({elapsed:.1f}s elapsed)"
+        )
         self.logger.error(message)
         raise TimeoutError(message)
     
+    async def wait_for_many(
+        self,
+        request_ids: Iterable[Union[str, UUID]],
+        timeout: int = 300,
+        poll_interval: int = 5,
+        max_concurrency: int = _MAX_CONCURRENT_STATUS_CHECKS,
+    ) -> Dict[str, AnalysisStatus]:
+        """Wait for several analyses to complete asynchronously.
+        
+        Use iter_completed() instead to handle each analysis as soon as it
+        finishes.
+        
+        Args:
+            request_ids: The analysis request IDs
+            timeout: Maximum time to wait in seconds for all analyses
+            poll_interval: Longest time between polling rounds in seconds
+            max_concurrency: Maximum number of status checks in flight
+            
+        Returns:
+            Final AnalysisStatus objects keyed by request ID, in the same
+            order as request_ids
+            
+        Raises:
+            TimeoutError: If any analysis doesn't complete within the timeout
+            Same exceptions as check_status()
+        """
+        request_ids = [str(rid) for rid in request_ids]
+        finished = {
+            request_id: status
+            async for request_id, status in self.iter_completed(
+                request_ids, timeout, poll_interval, max_concurrency
+            )
+        }
+        return {rid: finished[rid] for rid in request_ids}
+    
     async def download_report(
         self, 
         report_url: str,
         output_path: Union[str, Path],
+        revalidate: bool = False,
     ) -> Path:
         """Download a PDF report asynchronously.
         
+        With revalidate, the response's ETag and the report URL are stored
+        in a ``<output_path>.etag`` file next to the PDF, so downloading the
+        same URL to the same path again skips the body if the report has
+        not changed.
+        
         Args:
             report_url: URL to the PDF report
             output_path: Path where the PDF should be saved
+            revalidate: Whether to keep an ETag file next to the PDF and
+                skip unchanged downloads
             
         Returns:
             Path to the saved PDF file
@@ -1012,7 +1703,7 @@ class AsyncBridgeIQClient:
             ResourceNotFoundError: If the report doesn't exist
             BridgeIQError: For other API errors
         """
-        self.logger.info(f"Downloading report from {report_url}")
+        self.logger.info("Downloading report from %s", report_url)
         
         # Determine if we need to use a full URL or just the path
         if report_url.startswith("http"):
@@ -1021,27 +1712,67 @@ class AsyncBridgeIQClient:
             # If it's a path, join with base URL
             url = urljoin(self.base_url, report_url.lstrip("/"))
         
-        # Get client
-        client = await self._get_client()
+        # Deferred like every httpx use, so the sync client never loads it
+        import httpx
+        
+        # PDFs are already compressed, so ask for the raw bytes rather than
+        # a gzip stream that would be decoded again on the way to disk
+        headers = {"Accept-Encoding": "identity"}
+        
+        # Revalidate an earlier download of the same report instead of
+        # fetching the whole file again
+        output_file = Path(output_path)
+        etag = (
+            await asyncio.to_thread(_read_etag, output_file, url)
+            if revalidate else None
+        )
+        if etag:
+            headers["If-None-Match"] = etag
+        
+        # Send request without the client's credentials, since report
+        # links may point outside the API host
+        response = await self._request(
+            "GET", url, "report download",
+            authenticated=False, headers=headers, stream=True,
+        )
         
         try:
-            # Send request
-            response = await client.get(
-                url=url,
-                timeout=self.timeout,
-            )
-            
-            # Handle successful response
-            if response.status_code == 200:
-                # Save the PDF
-                output_file = save_file(response.content, output_path)
-                self.logger.info(f"Report saved to {output_file}")
+            if response.status_code == 304:
+                self.logger.info("Report unchanged, keeping %s", output_file)
                 return output_file
             
             # Handle error responses
-            await self._handle_error_response(response, "report download")
+            if response.status_code != 200:
+                await response.aread()
+                raise_for_response(response, self.logger, "report download")
+            
+            # Stream the PDF to a temporary file, keeping file I/O off the
+            # event loop, and move it into place only once it is complete
+            await asyncio.to_thread(
+                output_file.parent.mkdir, parents=True, exist_ok=True
+            )
+            f, temp_path = await asyncio.to_thread(open_partial_file, output_file)
+            try:
+                try:
+                    async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+                await asyncio.to_thread(os.replace, temp_path, output_file)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
             
+            # Only record the ETag once the new report is in place; an ETag
+            # left by an earlier download no longer matches the file
+            await asyncio.to_thread(
+                _write_etag, output_file, url,
+                response.headers.get("ETag") if revalidate else None,
+            )
         except httpx.RequestError as e:
-            message = f"Connection error during report download: {str(e)}"
-            self.logger.error(message)
-            raise ConnectionError(message) from e 
\ No newline at end of file
+            raise _connection_error(self.logger, "report download", e) from e
+        finally:
+            await response.aclose()
+        
+        self.logger.info("Report saved to %s", output_file)
+        return output_file
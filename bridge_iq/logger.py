@@ -6,13 +6,101 @@ supports different log levels and formats.
 """
 import logging
 import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+import weakref
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional, Union
 
 import platformdirs
 
+# Background handlers to reset in forked children
+_BACKGROUND_HANDLERS: "weakref.WeakSet[_BackgroundHandler]" = weakref.WeakSet()
+
+
+class _BackgroundHandler(QueueHandler):
+    """Hand records to handlers that run on a background listener thread.
+    
+    The listener is started by the first record rather than at setup, so
+    configuring a logger starts no thread. Once the handler is closed,
+    which logging.shutdown() does at exit, records are written directly
+    instead of being queued for a listener that is gone.
+    
+    The listener thread does not survive os.fork(), so forked children
+    get a fresh queue and start their own listener on their first record.
+    """
+    
+    def __init__(self, *handlers: logging.Handler):
+        """Initialize the handler.
+        
+        Args:
+            handlers: Handlers run on the listener thread
+        """
+        super().__init__(queue.Queue(-1))
+        self.handlers = handlers
+        self._listener: Optional[QueueListener] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        _BACKGROUND_HANDLERS.add(self)
+    
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's queue and listener in a forked child."""
+        self.queue = queue.Queue(-1)
+        self._listener = None
+        self._start_lock = threading.Lock()
+    
+    def _start_listener(self) -> None:
+        """Start the listener thread if it is not running yet."""
+        with self._start_lock:
+            if self._listener is None:
+                listener = QueueListener(
+                    self.queue, *self.handlers, respect_handler_level=True
+                )
+                listener.start()
+                self._listener = listener
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Queue a record, or write it directly after close()."""
+        if self._closed:
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        
+        if self._listener is None:
+            self._start_listener()
+        super().emit(record)
+    
+    def flush(self) -> None:
+        """Wait until the listener has written every queued record."""
+        if self._listener is not None:
+            self.queue.join()
+        for handler in self.handlers:
+            handler.flush()
+    
+    def close(self) -> None:
+        """Write out queued records and stop the listener thread."""
+        with self._start_lock:
+            listener, self._listener = self._listener, None
+            self._closed = True
+        if listener is not None:
+            listener.stop()
+        for handler in self.handlers:
+            handler.flush()
+        super().close()
+
+
+def _reset_background_handlers() -> None:
+    """Reset every background handler in a newly forked child."""
+    for handler in list(_BACKGROUND_HANDLERS):
+        handler._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_background_handlers)
+
 
 def setup_logger(
     name: str = "bridge_iq",
@@ -22,9 +110,15 @@ def setup_logger(
     max_file_size: int = 10 * 1024 * 1024,  # 10 MB
     backup_count: int = 3,
     format_string: Optional[str] = None,
+    include_location: bool = False,
 ) -> logging.Logger:
     """Set up a logger with console and optional file handlers.
     
+    Console output is written synchronously, so it is never lost or
+    reordered. File output goes through a queue drained by a background
+    thread, started on the first record, so the logging call never waits
+    for disk writes or log rotation.
+    
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -33,6 +127,7 @@ def setup_logger(
         max_file_size: Maximum size of log file before rotation (bytes)
         backup_count: Number of backup log files to keep
         format_string: Custom format string for log messages
+        include_location: Add the source file and line to the default format
         
     Returns:
         Configured logger instance
@@ -49,10 +144,13 @@ def setup_logger(
         
         # Create formatter
         if format_string is None:
-            format_string = (
-                "%(asctime)s - %(name)s - %(levelname)s - "
-                "%(filename)s:%(lineno)d - %(message)s"
-            )
+            if include_location:
+                format_string = (
+                    "%(asctime)s - %(name)s - %(levelname)s - "
+                    "%(filename)s:%(lineno)d - %(message)s"
+                )
+            else:
+                format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         formatter = logging.Formatter(format_string)
         
         # Console handler
@@ -79,7 +177,9 @@ def setup_logger(
                 backupCount=backup_count,
             )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+            
+            # Hand records to a listener thread that owns the file
+            logger.addHandler(_BackgroundHandler(file_handler))
     
     return logger
 
@@ -5,11 +5,12 @@ This module provides Pydantic models for the BridgeIQ API responses
 and request data.
 """
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, NamedTuple, Optional, Union, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnalysisStatusEnum(str, Enum):
@@ -37,8 +38,22 @@ class PDFStatusEnum(str, Enum):
     FAILED = "FAILED"
 
 
+# Analysis status values grouped by state, for O(1) membership checks
+_COMPLETED_STATUSES = frozenset({
+    AnalysisStatusEnum.COMPLETED.value,
+    AnalysisStatusEnum.MANUAL_COMPLETED.value,
+})
+_PROCESSING_STATUSES = frozenset({
+    AnalysisStatusEnum.PENDING.value,
+    AnalysisStatusEnum.PROCESSING.value,
+})
+_FAILED_STATUS = AnalysisStatusEnum.FAILED.value
+
+
 class AnalysisRequest(BaseModel):
     """Model for an analysis request response."""
+    model_config = ConfigDict(frozen=True, populate_by_name=True, extra="ignore")
+    
     analysis_id: str = Field(..., description="Unique identifier for the analysis (UUID)")
     request_id: str = Field(..., description="Unique identifier for the request (UUID)")
     radiography_type: str = Field(..., description="Type of radiography that was analyzed")
@@ -46,20 +61,22 @@ class AnalysisRequest(BaseModel):
     patient_id: Optional[str] = Field(None, description="Your provided patient identifier")
     check_analysis_url: str = Field(..., description="URL to check the status of the analysis")
     
-    @property
+    @cached_property
     def uuid(self) -> UUID:
-        """Get the analysis request ID as a UUID object."""
+        """Get the analysis request ID as a UUID object, parsed on first access."""
         return UUID(self.request_id)
 
 
 class AnalysisStatus(BaseModel):
     """Model for an analysis status response."""
+    model_config = ConfigDict(frozen=True, populate_by_name=True, extra="ignore")
+    
     analysis_id: str = Field(..., description="Unique identifier for the analysis (UUID)")
     request_id: str = Field(..., description="Unique identifier for the request (UUID)")
     radiography_type: str = Field(..., description="Type of radiography that was analyzed")
     patient_id: Optional[str] = Field(None, description="Your provided patient identifier")
-    created_at: str = Field(..., description="ISO-8601 timestamp when the analysis request was created")
-    updated_at: str = Field(..., description="ISO-8601 timestamp when the analysis was last updated")
+    created_at: datetime = Field(..., description="Time the analysis request was created")
+    updated_at: datetime = Field(..., description="Time the analysis was last updated")
     analysis_status: str = Field(..., description="Current status of the analysis")
     error_message: Optional[str] = Field(None, description="Error message if analysis failed")
     report_id: Optional[str] = Field(None, description="Unique identifier for the generated report (UUID)")
@@ -71,20 +88,17 @@ class AnalysisStatus(BaseModel):
     @property
     def is_completed(self) -> bool:
         """Check if the analysis is complete and successful."""
-        return self.analysis_status in (AnalysisStatusEnum.COMPLETED.value, AnalysisStatusEnum.MANUAL_COMPLETED.value)
+        return self.analysis_status in _COMPLETED_STATUSES
     
     @property
     def is_failed(self) -> bool:
         """Check if the analysis has failed."""
-        return self.analysis_status == AnalysisStatusEnum.FAILED.value
+        return self.analysis_status == _FAILED_STATUS
     
     @property
     def is_processing(self) -> bool:
         """Check if the analysis is still processing."""
-        return self.analysis_status in (
-            AnalysisStatusEnum.PENDING.value, 
-            AnalysisStatusEnum.PROCESSING.value
-        )
+        return self.analysis_status in _PROCESSING_STATUSES
     
     @property
     def has_report(self) -> bool:
@@ -101,22 +115,55 @@ class AnalysisStatus(BaseModel):
     
     @property
     def created_datetime(self) -> datetime:
-        """Get the created_at timestamp as a datetime object."""
-        return datetime.fromisoformat(self.created_at)
+        """Get the created_at timestamp (kept for backwards compatibility)."""
+        return self.created_at
     
     @property
     def updated_datetime(self) -> datetime:
-        """Get the updated_at timestamp as a datetime object."""
-        return datetime.fromisoformat(self.updated_at)
+        """Get the updated_at timestamp (kept for backwards compatibility)."""
+        return self.updated_at
+
+
+class StatusLite(NamedTuple):
+    """Minimal analysis status returned by ``check_status(lightweight=True)``.
+    
+    Built directly from the response data without model validation, for
+    callers polling many analyses that only need to know when they finish.
+    """
+    request_id: str
+    analysis_status: str
+    report_pdf_link: Optional[str] = None
+    
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> "StatusLite":
+        """Build a StatusLite from the ``data`` object of a status response."""
+        return cls(data["request_id"], data["analysis_status"], data.get("report_pdf_link"))
+    
+    @property
+    def is_completed(self) -> bool:
+        """Check if the analysis is complete and successful."""
+        return self.analysis_status in _COMPLETED_STATUSES
+    
+    @property
+    def is_failed(self) -> bool:
+        """Check if the analysis has failed."""
+        return self.analysis_status == _FAILED_STATUS
+    
+    @property
+    def is_processing(self) -> bool:
+        """Check if the analysis is still processing."""
+        return self.analysis_status in _PROCESSING_STATUSES
 
 
 class AnalysisResult(BaseModel):
     """Model for a complete analysis result."""
+    model_config = ConfigDict(frozen=True, populate_by_name=True, extra="ignore")
+    
     analysis_id: str = Field(..., description="Unique identifier for the analysis (UUID)")
     result_data: Dict[str, Any] = Field(..., description="Complete analysis result data")
-    created_at: str = Field(..., description="ISO-8601 timestamp when the analysis result was created")
+    created_at: datetime = Field(..., description="Time the analysis result was created")
     
     @property
     def created_datetime(self) -> datetime:
-        """Get the created_at timestamp as a datetime object."""
-        return datetime.fromisoformat(self.created_at) 
\ No newline at end of file
+        """Get the created_at timestamp (kept for backwards compatibility)."""
+        return self.created_at 
\ No newline at end of file
@@ -4,21 +4,37 @@ Utility functions for the BridgeIQ client.
 This module provides helper functions, including device ID generation,
 file handling, and user agent construction.
 """
+import asyncio
+import functools
 import os
 import platform
+import re
 import socket
+import struct
 import sys
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import BinaryIO, Dict, Iterable, Optional, Tuple, Union
 
 import platformdirs
 
+# Kodak/Carestream RVG files carry one of these signatures near the start
+_RVG_SIGNATURES = re.compile(rb"RVGIMG|CSDRAY|Carestream")
 
+# File extensions of DICOM and Kodak/Carestream RVG images
+_DICOM_EXTENSIONS = (".dcm", ".rvg")
+
+# Explicit VRs whose length field is 4 bytes, preceded by 2 reserved bytes
+_LONG_VRS = frozenset({b"OB", b"OD", b"OF", b"OL", b"OW", b"SQ", b"UC", b"UN", b"UR", b"UT"})
+
+
+@functools.lru_cache(maxsize=1)
 def get_machine_id() -> str:
     """Get a unique, persistent ID for the current machine.
     
+    The ID is read from disk once per process and cached afterwards.
+    
     Returns:
         Unique machine identifier string
     """
@@ -47,11 +63,15 @@ def get_machine_id() -> str:
     return machine_id
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_agent() -> str:
     """Generate a detailed User-Agent string.
     
     Format: BridgeIQ-Client/VERSION (OS/VERSION; PYTHON/VERSION; MACHINE/ID)
     
+    Every input is fixed for the life of the process, so the string is
+    built once and cached.
+    
     Returns:
         User-Agent string
     """
@@ -64,15 +84,20 @@ def get_user_agent() -> str:
     return f"BridgeIQ-Client/{__version__} ({os_info}; {python_info}; Machine/{machine_id[:8]})"
 
 
-def is_dicom_file(file_content: bytes) -> bool:
+def is_dicom_file(file_content: bytes, filename: Optional[str] = None) -> bool:
     """Check if a file is in DICOM format.
     
     Args:
         file_content: Binary file content
+        filename: Optional file name, used to recognize .dcm and .rvg files
         
     Returns:
         True if the file appears to be a DICOM file, False otherwise
     """
+    # Check if the file has a DICOM or Kodak/Carestream RVG extension
+    if filename and filename.lower().endswith(_DICOM_EXTENSIONS):
+        return True
+    
     # DICOM files should begin with a 128-byte preamble
     # followed by the string 'DICM'
     if len(file_content) < 132:
@@ -82,20 +107,46 @@ def is_dicom_file(file_content: bytes) -> bool:
     if file_content[128:132] == b'DICM':
         return True
     
-    # Check for Kodak/Carestream RVG file signatures
-    # Kodak/Carestream RVG files often have specific signatures
-    if any(signature in file_content[:100] for signature in [b'RVGIMG', b'CSDRAY', b'Carestream']):
-        return True
-    
-    # Check if the file has a .dcm extension
-    if file_content.endswith(b'.dcm'):
-        return True
+    # Check for Kodak/Carestream RVG file signatures in the header
+    return _RVG_SIGNATURES.search(file_content, 0, 100) is not None
+
+
+def dicom_transfer_syntax(header: bytes) -> Optional[str]:
+    """Read the Transfer Syntax UID from a DICOM file meta header.
     
-    # Check for .rvg extension which is used by Kodak/Carestream
-    if file_content.endswith(b'.rvg'):
-        return True
+    Args:
+        header: Start of the file, including the preamble and the file
+            meta information group (a few hundred bytes is usually enough)
         
-    return False
+    Returns:
+        The Transfer Syntax UID (0002,0010), or None if the header is not
+        DICOM or the element is not within it
+    """
+    if header[128:132] != b"DICM":
+        return None
+    
+    # The file meta group is always explicit VR little endian
+    position = 132
+    try:
+        while True:
+            group, element = struct.unpack_from("<HH", header, position)
+            if group != 0x0002:
+                return None
+            vr = header[position + 4:position + 6]
+            if vr in _LONG_VRS:
+                (length,) = struct.unpack_from("<I", header, position + 8)
+                position += 12
+            else:
+                (length,) = struct.unpack_from("<H", header, position + 6)
+                position += 8
+            if element == 0x0010:
+                if position + length > len(header):
+                    return None
+                value = header[position:position + length]
+                return value.rstrip(b"\0 ").decode("ascii", "replace")
+            position += length
+    except struct.error:
+        return None
 
 
 def get_file_content(file_path: Union[str, Path]) -> bytes:
@@ -140,4 +191,96 @@ def save_file(content: bytes, file_path: Union[str, Path]) -> Path:
     with open(path, "wb") as f:
         f.write(content)
     
-    return path 
\ No newline at end of file
+    return path
+
+
+async def aget_file_content(file_path: Union[str, Path]) -> bytes:
+    """Read file content as bytes without blocking the event loop.
+    
+    Runs get_file_content() in a worker thread.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        File content as bytes
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        IOError: If the file can't be read
+    """
+    return await asyncio.to_thread(get_file_content, file_path)
+
+
+async def asave_file(content: bytes, file_path: Union[str, Path]) -> Path:
+    """Save content to a file without blocking the event loop.
+    
+    Runs save_file() in a worker thread.
+    
+    Args:
+        content: Binary content to save
+        file_path: Path where the file should be saved
+        
+    Returns:
+        Path to the saved file
+        
+    Raises:
+        IOError: If the file can't be written
+    """
+    return await asyncio.to_thread(save_file, content, file_path)
+
+
+def open_partial_file(file_path: Union[str, Path]) -> Tuple[BinaryIO, Path]:
+    """Open a new temporary file next to a file that is about to be written.
+    
+    Content written to the temporary file can be moved into place with
+    ``os.replace``, so readers never see a partially written file.
+    
+    Args:
+        file_path: Path of the file that will eventually be written
+        
+    Returns:
+        Tuple of the open binary file and its temporary path
+        
+    Raises:
+        IOError: If the file can't be created
+    """
+    path = Path(file_path)
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.part")
+    return open(temp_path, "xb"), temp_path
+
+
+def save_stream(chunks: Iterable[bytes], file_path: Union[str, Path]) -> Path:
+    """Save an iterable of byte chunks to a file.
+    
+    Unlike save_file(), the content never has to be held in memory as a
+    whole, which keeps large downloads at constant memory usage. The
+    chunks are written to a temporary file that replaces the target only
+    once complete, so a failed stream leaves any existing file untouched.
+    
+    Args:
+        chunks: Iterable yielding binary content
+        file_path: Path where the file should be saved
+        
+    Returns:
+        Path to the saved file
+        
+    Raises:
+        IOError: If the file can't be written
+    """
+    path = Path(file_path)
+    
+    # Create directory if it doesn't exist
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    f, temp_path = open_partial_file(path)
+    try:
+        with f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    
+    return path
@@ -4,83 +4,186 @@ Diagnostic test script for the BridgeIQ client library.
 This script performs detailed diagnostics to identify and resolve
 the 422 Unprocessable Entity errors when submitting DICOM images.
 """
+import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import MappingProxyType
 from urllib.parse import urljoin
 
+import platformdirs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from bridge_iq import BridgeIQClient, AsyncBridgeIQClient, Environment
 from bridge_iq.logger import setup_logger
-from bridge_iq.exceptions import BridgeIQError
 
 # Configure logging - more verbose for diagnostics
 logger = setup_logger(level=logging.DEBUG, log_to_file=False)
 
-# Ensure sample-pdf directory exists
+def dump_json(data):
+    """Serialize data as indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+# Shared session so direct requests reuse keep-alive connections
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5),
+)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
+# Directory where downloaded reports and results are written
 sample_pdf_dir = Path("sample-pdf")
-sample_pdf_dir.mkdir(exist_ok=True)
 
-# Load credentials from the JSON file
-try:
-    with open("test_credentials.json", "r") as f:
-        credentials = json.load(f)
-except (FileNotFoundError, json.JSONDecodeError) as e:
-    logger.error(f"Error loading credentials: {e}")
-    sys.exit(1)
+# Maximum number of images processed at the same time
+MAX_CONCURRENT_IMAGES = 8
+
+# Working parameters found by a previous run, reused for an hour
+VALIDATED_PARAMS_CACHE = Path(platformdirs.user_cache_dir("bridge-iq")) / "validated_params.json"
+VALIDATED_PARAMS_TTL = 3600
 
-# Extract required credentials
-client_id = credentials.get("client_id")
-client_secret = credentials.get("client_secret")
-device_path = credentials.get("api_device_path")
-base_url = credentials.get("base_url"")
+# Submission errors that mean the cached parameters are no longer valid
+INVALIDATING_STATUS_CODES = frozenset({401, 422})
 
-if not all([client_id, client_secret, device_path]):
-    logger.error("Missing required credentials. Please check test_credentials.json")
-    sys.exit(1)
+# Headers sent with every direct request
+DIRECT_REQUEST_HEADERS = MappingProxyType({
+    "User-Agent": "BridgeIQ-DiagnosticTest/1.0",
+})
 
-# List all DICOM files in the sample-images directory
-sample_images_dir = Path("sample-images")
-sample_images = list(sample_images_dir.glob("*.dcm"))
+# Parameter combinations tried by try_different_parameters, read-only
+PARAMETER_COMBINATIONS = tuple(MappingProxyType(params) for params in [
+    # Default parameters
+    {},
+    
+    # Explicitly set all params we think might be required
+    {
+        "radiography_type": "panoramic_adult",
+        "patient_id": "TEST-123",
+        "patient_name": "Test Patient",
+        "patient_gender": "M",
+        "patient_dob": "1990-01-01",
+    },
+    
+    # Try different radiography types
+    {"radiography_type": "bitewing"},
+    {"radiography_type": "periapical"},
+    
+    # Try with minimal parameters
+    {"radiography_type": "panoramic_adult"},
+    
+    # Try changing structure type of params
+    {"structure_type": "2d"},
+    {"report_format": "pdf"},
+    
+    # Try with all uppercase values
+    {"radiography_type": "PANORAMIC_ADULT"},
+])
 
-if not sample_images:
-    logger.error("No DICOM images found in the sample-images directory")
-    sys.exit(1)
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """
+    Load the test credentials and sample images on first use.
+    
+    Returns a (credentials, sample_images) tuple; the credentials dict uses
+    the client's keyword argument names. Exits if either is missing.
+    """
+    # Ensure sample-pdf directory exists
+    sample_pdf_dir.mkdir(exist_ok=True)
+    
+    # Load credentials from the JSON file
+    try:
+        with open("test_credentials.json", "r") as f:
+            credentials = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        logger.error(f"Error loading credentials: {e}")
+        sys.exit(1)
+    
+    # Extract required credentials
+    client_id = credentials.get("client_id")
+    client_secret = credentials.get("client_secret")
+    device_path = credentials.get("api_device_path")
+    base_url = credentials.get("base_url")
+    
+    if not all([client_id, client_secret, device_path, base_url]):
+        logger.error("Missing required credentials. Please check test_credentials.json")
+        sys.exit(1)
+    
+    # List all DICOM files in the sample-images directory
+    sample_images_dir = Path("sample-images")
+    sample_images = list(sample_images_dir.glob("*.dcm"))
+    
+    if not sample_images:
+        logger.error("No DICOM images found in the sample-images directory")
+        sys.exit(1)
+    
+    logger.info(f"Found {len(sample_images)} DICOM images for testing")
+    logger.info(f"Using credentials - Client ID: {client_id}, Device Path: {device_path}")
+    logger.info(f"Base URL: {base_url}")
+    
+    credentials = {
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "device_path": device_path,
+        "base_url": base_url,
+    }
+    return credentials, sample_images
 
-logger.info(f"Found {len(sample_images)} DICOM images for testing")
-logger.info(f"Using credentials - Client ID: {client_id}, Device Path: {device_path}")
-logger.info(f"Base URL: {base_url}")
+@functools.lru_cache(maxsize=1)
+def _request_url():
+    """Resolve the device requests endpoint once per run."""
+    credentials, _ = _load_env()
+    return urljoin(
+        credentials["base_url"],
+        f"/api/v1/webhooks/devices/{credentials['device_path']}/requests",
+    )
 
-def send_direct_request(image_path, additional_params=None):
+def send_direct_request(image_path, additional_params=None, image_bytes=None):
     """
     Send a direct request to the API with explicit parameters to identify validation issues.
+    
+    Pass image_bytes to reuse an image already read by the caller instead of
+    opening image_path again.
     """
     logger.info(f"Testing direct request with image: {image_path.name}")
     
-    # Read image data
-    with open(image_path, "rb") as f:
-        image_data = f.read()
-        logger.info(f"Image read successfully: {len(image_data)} bytes")
+    if image_bytes is not None:
+        image_file = None
+        image_content = image_bytes
+        logger.info(f"Using preloaded image: {len(image_bytes)} bytes")
+    else:
+        # Open the image; requests reads it while encoding the body, so no
+        # separate in-memory copy of the file is made here
+        image_file = image_content = open(image_path, "rb")
+        logger.info(f"Image opened successfully: {os.fstat(image_file.fileno()).st_size} bytes")
+    
+    credentials, _ = _load_env()
     
     # Prepare request URL
-    url = urljoin(base_url, f"/api/v1/webhooks/devices/{device_path}/requests")
+    url = _request_url()
     logger.info(f"Request URL: {url}")
     
-    # Prepare headers
-    headers = {
-        "User-Agent": "BridgeIQ-DiagnosticTest/1.0",
-    }
-    
     # Prepare form data with required fields
     form_data = {
-        "image": (image_path.name, image_data),
-        "client_id": (None, client_id),
-        "client_secret": (None, client_secret),
+        "image": (image_path.name, image_content, "application/dicom"),
+        "client_id": (None, credentials["client_id"]),
+        "client_secret": (None, credentials["client_secret"]),
         "report_type": (None, "standard"),
     }
     
@@ -98,10 +201,10 @@ def send_direct_request(image_path, additional_params=None):
     # Send request with detailed debugging
     try:
         logger.info("Sending direct API request...")
-        response = requests.post(
+        response = session.post(
             url=url,
             files=form_data,
-            headers=headers,
+            headers=DIRECT_REQUEST_HEADERS,
             timeout=180,
         )
         
@@ -110,7 +213,7 @@ def send_direct_request(image_path, additional_params=None):
         # Attempt to parse response as JSON
         try:
             data = response.json()
-            logger.info(f"Response body: {json.dumps(data, indent=2)}")
+            logger.info(f"Response body: {dump_json(data).decode()}")
             
             # Check for detailed error information
             if response.status_code == 422:
@@ -131,52 +234,55 @@ def send_direct_request(image_path, additional_params=None):
     except Exception as e:
         logger.error(f"Error sending direct request: {e}")
         return None
+    
+    finally:
+        if image_file is not None:
+            image_file.close()
+
+def _probe_parameters(test_image, parameter_combinations, image_bytes, parallel):
+    """Yield (params, response) for each combination in completion order."""
+    if not parallel:
+        for i, params in enumerate(parameter_combinations):
+            logger.info(f"Test {i+1}: Trying parameters: {params}")
+            yield params, send_direct_request(test_image, params, image_bytes=image_bytes)
+        return
+    
+    logger.info(f"Trying {len(parameter_combinations)} parameter combinations in parallel")
+    executor = ThreadPoolExecutor(max_workers=len(parameter_combinations))
+    try:
+        futures = {
+            executor.submit(send_direct_request, test_image, params, image_bytes=image_bytes): params
+            for params in parameter_combinations
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Drop probes that have not started once the caller stops early
+        executor.shutdown(wait=False, cancel_futures=True)
 
-def try_different_parameters():
-    """Try sending the same image with different parameter combinations."""
+def try_different_parameters(parallel=False):
+    """Try sending the same image with different parameter combinations.
+    
+    With parallel=True all combinations are sent at once and the first
+    success wins. This is faster, but every probe that succeeds submits an
+    analysis, so more than one may be charged.
+    """
     logger.info("===== Testing Different Parameter Combinations =====")
     
+    _, sample_images = _load_env()
     test_image = sample_images[0]
     logger.info(f"Selected test image: {test_image}")
     
-    # List of parameter combinations to try
-    parameter_combinations = [
-        # Default parameters
-        {},
-        
-        # Explicitly set all params we think might be required
-        {
-            "radiography_type": "panoramic_adult",
-            "patient_id": "TEST-123",
-            "patient_name": "Test Patient",
-            "patient_gender": "M",
-            "patient_dob": "1990-01-01",
-        },
-        
-        # Try different radiography types
-        {"radiography_type": "bitewing"},
-        {"radiography_type": "periapical"},
-        
-        # Try with minimal parameters
-        {"radiography_type": "panoramic_adult"},
-        
-        # Try changing structure type of params
-        {"structure_type": "2d"},
-        {"report_format": "pdf"},
-        
-        # Try with all uppercase values
-        {"radiography_type": "PANORAMIC_ADULT"},
-    ]
+    # Every combination uploads the same image, so read it only once
+    image_bytes = test_image.read_bytes()
     
     results = []
     
-    for i, params in enumerate(parameter_combinations):
-        logger.info(f"Test {i+1}: Trying parameters: {params}")
-        response = send_direct_request(test_image, params)
-        
+    probes = _probe_parameters(test_image, PARAMETER_COMBINATIONS, image_bytes, parallel)
+    for params, response in probes:
         if response:
             results.append({
-                "params": params,
+                "params": dict(params),
                 "status_code": response.status_code,
                 "success": response.status_code == 200
             })
@@ -184,7 +290,8 @@ def try_different_parameters():
             # If successful, break and use these parameters
             if response.status_code == 200:
                 logger.info(f"Success! Found working parameters: {params}")
-                return params
+                probes.close()
+                return dict(params)
     
     # Summarize results
     logger.info("===== Parameter Testing Results =====")
@@ -195,116 +302,196 @@ def try_different_parameters():
     logger.warning("No parameter combination was successful.")
     return None
 
-def test_sync_client_with_all_images(params=None):
-    """Test the synchronous BridgeIQ client with all sample images."""
-    logger.info("===== Testing Synchronous Client With All Images =====")
-    
-    # Initialize the client
-    client = BridgeIQClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        device_path=device_path,
-        base_url=base_url,
+def _create_sync_client():
+    """Create the synchronous client used by the diagnostics."""
+    credentials, _ = _load_env()
+    return BridgeIQClient(
+        **credentials,
         environment=Environment.PRODUCTION,
         timeout=180,
     )
+
+def _process_image_sync(client, i, image_path, params):
+    """Submit one image, wait for its analysis and download the report."""
+    logger.info(f"Processing image {i+1}/{len(_load_env()[1])}: {image_path.name}")
+    
+    # Prepare parameters for this image
+    image_params = {
+        "patient_id": f"TEST-SYNC-{i+1}",
+        "patient_name": f"Test Patient {i+1}",
+        "radiography_type": "panoramic_adult",
+        "report_type": "standard",
+    }
+    
+    # Update with custom params if provided
+    if params:
+        image_params.update(params)
+    
+    # Send the image for analysis
+    analysis = client.send_analysis(
+        image_path=image_path,
+        **image_params
+    )
+    
+    logger.info(f"Analysis submitted successfully! Request ID: {analysis.request_id}")
+    
+    # Wait for analysis to complete
+    status = client.wait_for_completion(
+        request_id=analysis.request_id,
+        timeout=600,  # 10 minutes
+        poll_interval=30,  # Backs off from 0.25s to at most 30s between checks
+    )
+    
+    logger.info(f"Analysis status: {status.analysis_status}")
     
+    # Download report if available
+    if status.is_completed and status.has_pdf:
+        pdf_path = sample_pdf_dir / f"report_{i+1}_{analysis.request_id}.pdf"
+        
+        client.download_report(
+            report_url=status.report_pdf_link,
+            output_path=pdf_path,
+        )
+        
+        logger.info(f"Report downloaded to {pdf_path}")
+        return {
+            "image": image_path.name,
+            "status": "success",
+            "pdf_path": str(pdf_path),
+            "request_id": analysis.request_id
+        }
+    
+    logger.warning(f"No PDF available for {image_path.name}")
+    return {
+        "image": image_path.name,
+        "status": "no_pdf" if status.is_completed else status.analysis_status,
+        "request_id": analysis.request_id
+    }
+
+def test_sync_client_with_all_images(params=None, client=None, skip_health=False):
+    """Test the synchronous BridgeIQ client with all sample images.
+    
+    Pass an open client to reuse its connections (it is left open), and
+    skip_health=True if the API was checked just before.
+    """
+    logger.info("===== Testing Synchronous Client With All Images =====")
+    
+    # Initialize the client unless the caller provided one
+    owns_client = client is None
+    if owns_client:
+        client = _create_sync_client()
+    
+    _, sample_images = _load_env()
     results = []
     
     try:
         # Verify API is available
-        is_healthy = client.health_check()
-        logger.info(f"API health check result: {'Healthy' if is_healthy else 'Unhealthy'}")
-        
-        if not is_healthy:
-            logger.warning("API health check failed. Skipping tests.")
-            return results
-        
-        # Process each image
-        for i, image_path in enumerate(sample_images):
-            logger.info(f"Processing image {i+1}/{len(sample_images)}: {image_path.name}")
+        if not skip_health:
+            is_healthy = client.health_check()
+            logger.info(f"API health check result: {'Healthy' if is_healthy else 'Unhealthy'}")
             
+            if not is_healthy:
+                logger.warning("API health check failed. Skipping tests.")
+                return results
+        
+        # Process images on a thread pool; the threads share the client's
+        # session, so its connection pool is reused across images
+        def run_one(indexed_path):
+            i, image_path = indexed_path
             try:
-                # Prepare parameters for this image
-                image_params = {
-                    "patient_id": f"TEST-SYNC-{i+1}",
-                    "patient_name": f"Test Patient {i+1}",
-                    "radiography_type": "panoramic_adult",
-                    "report_type": "standard",
-                }
-                
-                # Update with custom params if provided
-                if params:
-                    image_params.update(params)
-                
-                # Send the image for analysis
-                analysis = client.send_analysis(
-                    image_path=image_path,
-                    **image_params
-                )
-                
-                logger.info(f"Analysis submitted successfully! Request ID: {analysis.request_id}")
-                
-                # Wait for analysis to complete
-                status = client.wait_for_completion(
-                    request_id=analysis.request_id,
-                    timeout=600,  # 10 minutes
-                    poll_interval=10,  # Check every 10 seconds
-                )
-                
-                logger.info(f"Analysis status: {status.analysis_status}")
-                
-                # Download report if available
-                if status.is_completed and status.has_pdf:
-                    pdf_path = sample_pdf_dir / f"report_{i+1}_{analysis.request_id}.pdf"
-                    
-                    client.download_report(
-                        report_url=status.report_pdf_link,
-                        output_path=pdf_path,
-                    )
-                    
-                    logger.info(f"Report downloaded to {pdf_path}")
-                    results.append({
-                        "image": image_path.name,
-                        "status": "success",
-                        "pdf_path": str(pdf_path),
-                        "request_id": analysis.request_id
-                    })
-                else:
-                    logger.warning(f"No PDF available for {image_path.name}")
-                    results.append({
-                        "image": image_path.name,
-                        "status": "no_pdf" if status.is_completed else status.analysis_status,
-                        "request_id": analysis.request_id
-                    })
-            
+                return _process_image_sync(client, i, image_path, params)
             except Exception as e:
                 logger.error(f"Error processing {image_path.name}: {e}")
-                results.append({
+                return {
                     "image": image_path.name,
                     "status": "error",
-                    "error": str(e)
-                })
+                    "error": str(e),
+                    "status_code": getattr(e, "status_code", None)
+                }
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_IMAGES, len(sample_images))) as executor:
+            results.extend(executor.map(run_one, enumerate(sample_images)))
     
     except Exception as e:
         logger.error(f"Error in synchronous client test: {e}")
     
     finally:
-        client.close()
+        if owns_client:
+            client.close()
         logger.info("Synchronous client test completed")
         
     return results
 
-async def test_async_client_with_all_images(params=None):
-    """Test the asynchronous BridgeIQ client with all sample images."""
+async def _process_image_async(client, i, image_path, params, semaphore):
+    """Submit one image, wait for its analysis and download the report."""
+    async with semaphore:
+        logger.info(f"Processing image {i+1}/{len(_load_env()[1])}: {image_path.name}")
+        
+        # Prepare parameters for this image
+        image_params = {
+            "patient_id": f"TEST-ASYNC-{i+1}",
+            "patient_name": f"Test Patient {i+1}",
+            "radiography_type": "panoramic_adult",
+            "report_type": "standard",
+        }
+        
+        # Update with custom params if provided
+        if params:
+            image_params.update(params)
+        
+        # Send the image for analysis
+        analysis = await client.send_analysis(
+            image_path=image_path,
+            **image_params
+        )
+        
+        logger.info(f"Analysis submitted successfully! Request ID: {analysis.request_id}")
+        
+        # Wait for analysis to complete
+        status = await client.wait_for_completion(
+            request_id=analysis.request_id,
+            timeout=600,  # 10 minutes
+            poll_interval=30,  # Backs off from 0.25s to at most 30s between checks
+        )
+        
+        logger.info(f"Analysis status: {status.analysis_status}")
+        
+        # Download report if available
+        if status.is_completed and status.has_pdf:
+            pdf_path = sample_pdf_dir / f"async_report_{i+1}_{analysis.request_id}.pdf"
+            
+            await client.download_report(
+                report_url=status.report_pdf_link,
+                output_path=pdf_path,
+            )
+            
+            logger.info(f"Report downloaded to {pdf_path}")
+            return {
+                "image": image_path.name,
+                "status": "success",
+                "pdf_path": str(pdf_path),
+                "request_id": analysis.request_id
+            }
+        
+        logger.warning(f"No PDF available for {image_path.name}")
+        return {
+            "image": image_path.name,
+            "status": "no_pdf" if status.is_completed else status.analysis_status,
+            "request_id": analysis.request_id
+        }
+
+async def test_async_client_with_all_images(params=None, skip_health=False):
+    """Test the asynchronous BridgeIQ client with all sample images.
+    
+    Pass skip_health=True if the API was checked just before.
+    """
     logger.info("===== Testing Asynchronous Client With All Images =====")
     
+    credentials, sample_images = _load_env()
+    
     # Initialize the client
     client = AsyncBridgeIQClient(
-        client_id=client_id,
-        client_secret=client_secret,
-        device_path=device_path,
-        base_url=base_url,
+        **credentials,
         environment=Environment.PRODUCTION,
         timeout=180,
     )
@@ -316,78 +503,35 @@ async def test_async_client_with_all_images(params=None):
         await client.__aenter__()
         
         # Verify API is available
-        is_healthy = await client.health_check()
-        logger.info(f"API health check result: {'Healthy' if is_healthy else 'Unhealthy'}")
+        if not skip_health:
+            is_healthy = await client.health_check()
+            logger.info(f"API health check result: {'Healthy' if is_healthy else 'Unhealthy'}")
+            
+            if not is_healthy:
+                logger.warning("API health check failed. Skipping tests.")
+                return results
         
-        if not is_healthy:
-            logger.warning("API health check failed. Skipping tests.")
-            return results
+        # Process all images concurrently over the client's connection pool
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGES)
+        outcomes = await asyncio.gather(
+            *[
+                _process_image_async(client, i, image_path, params, semaphore)
+                for i, image_path in enumerate(sample_images)
+            ],
+            return_exceptions=True,
+        )
         
-        # Process each image
-        for i, image_path in enumerate(sample_images):
-            logger.info(f"Processing image {i+1}/{len(sample_images)}: {image_path.name}")
-            
-            try:
-                # Prepare parameters for this image
-                image_params = {
-                    "patient_id": f"TEST-ASYNC-{i+1}",
-                    "patient_name": f"Test Patient {i+1}",
-                    "radiography_type": "panoramic_adult",
-                    "report_type": "standard",
-                }
-                
-                # Update with custom params if provided
-                if params:
-                    image_params.update(params)
-                
-                # Send the image for analysis
-                analysis = await client.send_analysis(
-                    image_path=image_path,
-                    **image_params
-                )
-                
-                logger.info(f"Analysis submitted successfully! Request ID: {analysis.request_id}")
-                
-                # Wait for analysis to complete
-                status = await client.wait_for_completion(
-                    request_id=analysis.request_id,
-                    timeout=600,  # 10 minutes
-                    poll_interval=10,  # Check every 10 seconds
-                )
-                
-                logger.info(f"Analysis status: {status.analysis_status}")
-                
-                # Download report if available
-                if status.is_completed and status.has_pdf:
-                    pdf_path = sample_pdf_dir / f"async_report_{i+1}_{analysis.request_id}.pdf"
-                    
-                    await client.download_report(
-                        report_url=status.report_pdf_link,
-                        output_path=pdf_path,
-                    )
-                    
-                    logger.info(f"Report downloaded to {pdf_path}")
-                    results.append({
-                        "image": image_path.name,
-                        "status": "success",
-                        "pdf_path": str(pdf_path),
-                        "request_id": analysis.request_id
-                    })
-                else:
-                    logger.warning(f"No PDF available for {image_path.name}")
-                    results.append({
-                        "image": image_path.name,
-                        "status": "no_pdf" if status.is_completed else status.analysis_status,
-                        "request_id": analysis.request_id
-                    })
-            
-            except Exception as e:
-                logger.error(f"Error processing {image_path.name}: {e}")
+        for image_path, outcome in zip(sample_images, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error processing {image_path.name}: {outcome}")
                 results.append({
                     "image": image_path.name,
                     "status": "error",
-                    "error": str(e)
+                    "error": str(outcome),
+                    "status_code": getattr(outcome, "status_code", None)
                 })
+            else:
+                results.append(outcome)
     
     except Exception as e:
         logger.error(f"Error in asynchronous client test: {e}")
@@ -398,29 +542,61 @@ async def test_async_client_with_all_images(params=None):
         
     return results
 
-async def main():
-    """Run diagnostic tests to fix the validation errors."""
+def _load_validated_params(base_url):
+    """Return the working parameters cached for base_url, or None if stale."""
+    try:
+        with open(VALIDATED_PARAMS_CACHE, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if cached.get("base_url") != base_url:
+        return None
+    if time.time() - cached.get("ts", 0) > VALIDATED_PARAMS_TTL:
+        return None
+    return cached.get("params")
+
+def _save_validated_params(base_url, params):
+    """Cache working parameters so the next run can skip the probes."""
+    try:
+        VALIDATED_PARAMS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(VALIDATED_PARAMS_CACHE, "wb") as f:
+            f.write(dump_json({"base_url": base_url, "params": params, "ts": time.time()}))
+    except OSError as e:
+        logger.warning(f"Could not cache working parameters: {e}")
+
+async def main(parallel_probes=False):
+    """Run diagnostic tests to fix the validation errors.
+    
+    With parallel_probes=True the parameter combinations are probed
+    concurrently; see try_different_parameters().
+    """
+    credentials, _ = _load_env()
+    base_url = credentials["base_url"]
+    
     try:
         # Check API health first
         logger.info("===== Checking API Availability =====")
-        client = BridgeIQClient(
-            client_id=client_id,
-            client_secret=client_secret,
-            device_path=device_path,
-            base_url=base_url,
-        )
+        client = _create_sync_client()
         
         is_healthy = client.health_check()
         logger.info(f"API health check result: {'Healthy' if is_healthy else 'Unhealthy'}")
-        client.close()
         
         if not is_healthy:
+            client.close()
             logger.error("API is not available. Cannot proceed with tests.")
             return
         
-        # First, test different parameter combinations to find working parameters
-        logger.info("Trying to find working parameters...")
-        working_params = try_different_parameters()
+        # Reuse the parameters validated by a recent run, otherwise test
+        # different parameter combinations to find working parameters
+        working_params = _load_validated_params(base_url)
+        if working_params:
+            logger.info(f"Using cached working parameters from {VALIDATED_PARAMS_CACHE}")
+        else:
+            logger.info("Trying to find working parameters...")
+            working_params = try_different_parameters(parallel=parallel_probes)
+            if working_params:
+                _save_validated_params(base_url, working_params)
         
         if working_params:
             logger.info(f"Will use working parameters: {working_params}")
@@ -432,11 +608,19 @@ async def main():
                 "patient_name": "Test Patient",
             }
         
-        # Run tests with synchronous client
-        sync_results = test_sync_client_with_all_images(working_params)
+        # Run tests with synchronous client, reusing the connection and the
+        # health check result from above
+        try:
+            sync_results = test_sync_client_with_all_images(
+                working_params, client=client, skip_health=True
+            )
+        finally:
+            client.close()
         
         # Run tests with asynchronous client
-        async_results = await test_async_client_with_all_images(working_params)
+        async_results = await test_async_client_with_all_images(
+            working_params, skip_health=True
+        )
         
         # Generate summary report
         logger.info("===== Test Results Summary =====")
@@ -450,24 +634,37 @@ async def main():
         logger.info(f"Synchronous successes: {sync_success}/{len(sync_results)}")
         logger.info(f"Asynchronous successes: {async_success}/{len(async_results)}")
         
+        # Drop the cached parameters if the API rejected them
+        if any(
+            r.get("status_code") in INVALIDATING_STATUS_CODES
+            for r in sync_results + async_results
+        ):
+            logger.warning("Submissions were rejected, clearing cached working parameters")
+            VALIDATED_PARAMS_CACHE.unlink(missing_ok=True)
+        
         # Check PDF files
-        pdf_files = list(sample_pdf_dir.glob("*.pdf"))
+        with os.scandir(sample_pdf_dir) as entries:
+            pdf_files = [
+                (entry.name, entry.stat().st_size)
+                for entry in entries
+                if entry.name.endswith(".pdf") and entry.is_file()
+            ]
         if pdf_files:
             logger.info(f"Generated {len(pdf_files)} PDF reports:")
-            for pdf in pdf_files:
-                logger.info(f"  - {pdf.name} ({pdf.stat().st_size} bytes)")
+            for name, size in pdf_files:
+                logger.info(f"  - {name} ({size} bytes)")
         else:
             logger.warning("No PDF files were generated during testing")
         
         # Save test results to file
         results_path = sample_pdf_dir / "test_results.json"
-        with open(results_path, "w") as f:
-            json.dump({
+        with open(results_path, "wb") as f:
+            f.write(dump_json({
                 "sync_results": sync_results,
                 "async_results": async_results,
                 "pdf_count": len(pdf_files),
                 "parameters_used": working_params
-            }, f, indent=2)
+            }))
         
         logger.info(f"Test results saved to {results_path}")
     
@@ -476,4 +673,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--parallel-probes",
+        action="store_true",
+        help="probe parameter combinations concurrently (may submit more than one analysis)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(parallel_probes=args.parallel_probes)) 
\ No newline at end of file
@@ -90,7 +90,7 @@ def main():
             status = client.wait_for_completion(
                 request_id=analysis.request_id,
                 timeout=600,  # 10 minutes
-                poll_interval=10,  # Check every 10 seconds
+                poll_interval=10,  # Poll at most every 10 seconds
             )
             
             logger.info(f"Analysis status: {status.analysis_status}")
@@ -28,16 +28,29 @@ setup(
         "Topic :: Scientific/Engineering :: Medical Science Apps.",
     ],
     packages=find_packages(include=["bridge_iq"]),
+    package_data={"bridge_iq": ["py.typed"]},
+    include_package_data=True,
+    zip_safe=False,
     python_requires=">=3.9,<3.13",
     install_requires=[
         "requests>=2.25.0",
         "uuid>=1.30",
         "platformdirs>=2.0.0",
         "httpx>=0.23.0",
-        "pydantic>=1.9.0",
+        "pydantic>=2.6.0",
         "python-dateutil>=2.8.2",
     ],
     extras_require={
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "orjson": [
+            "orjson>=3.6.0",
+        ],
+        "speed": [
+            "orjson>=3.6.0",
+            "httpx[http2]>=0.23.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "black>=22.0.0",
@@ -45,6 +58,7 @@ setup(
             "mypy>=0.910",
             "flake8>=4.0.0",
             "pytest-cov>=3.0.0",
+            "pytest-xdist>=2.0.0",
         ],
     },
 ) 
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Shared pytest configuration for the BridgeIQ tests.
+
+The suite is mock-only: any request that reaches a real transport fails
+the test instead of going out to the network. Client fixtures are scoped
+so that credentials are read once per run and each test module shares
+one client.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+import requests
+
+# Add parent directory to path for importing the library, once
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from bridge_iq import BridgeIQClient, Environment
+
+# Dummy credentials used when test_credentials.json is absent or invalid
+_FALLBACK_CREDENTIALS = {
+    "client_id": "test_client_id",
+    "client_secret": "test_client_secret",
+    "api_device_path": "test_device_path",
+    "base_url": "https://test.api.example.com/api/v1"
+}
+
+
+def _block_real_http(*args, **kwargs):
+    """Fail a test that sends a request without mocking it."""
+    raise RuntimeError("Real HTTP request attempted in tests; mock the session instead")
+
+
+async def _block_real_http_async(*args, **kwargs):
+    """Fail an async test that sends a request without mocking it."""
+    _block_real_http()
+
+
+@pytest.fixture(autouse=True)
+def _no_real_http(monkeypatch):
+    """Block the requests and httpx network transports for every test."""
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", _block_real_http)
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", _block_real_http)
+    monkeypatch.setattr(
+        httpx.AsyncHTTPTransport, "handle_async_request", _block_real_http_async
+    )
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def credentials():
+    """Load test credentials once per run, or fall back to dummies."""
+    try:
+        return json.loads(Path("test_credentials.json").read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return _FALLBACK_CREDENTIALS
+
+
+@pytest.fixture(scope="module")
+def client(credentials):
+    """Create one client per module; its session is never used for I/O."""
+    client = BridgeIQClient(
+        client_id=credentials["client_id"],
+        client_secret=credentials["client_secret"],
+        device_path=credentials["api_device_path"],
+        base_url=credentials["base_url"],
+        environment=Environment.TESTING,  # Use testing for tests
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mock_session(client, monkeypatch):
+    """Reset the shared client's caches and mock its session's get and post."""
+    client.invalidate_health_cache()
+    client._status_cache.clear()
+    monkeypatch.setattr(client.session, "get", mock.Mock())
+    monkeypatch.setattr(client.session, "post", mock.Mock())
+    return client.session
+
+
+@pytest.fixture
+def mock_get(mock_session):
+    """Mocked ``get`` of the shared client's session."""
+    return mock_session.get
+
+
+@pytest.fixture
+def mock_post(mock_session):
+    """Mocked ``post`` of the shared client's session."""
+    return mock_session.post
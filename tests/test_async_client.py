@@ -0,0 +1,177 @@
+"""
+Tests for the asynchronous BridgeIQ client.
+
+These tests verify the batched status helpers and uploads of the async
+client without making any network requests. They run on asyncio through
+the anyio pytest plugin, which ships with httpx's anyio dependency.
+"""
+import asyncio
+import os
+from unittest import mock
+
+import httpx
+import pytest
+
+from bridge_iq import AsyncBridgeIQClient, Environment
+from bridge_iq.exceptions import TimeoutError
+from bridge_iq.models import AnalysisStatus
+
+pytestmark = pytest.mark.anyio
+
+
+def _status(request_id, analysis_status):
+    """Build an AnalysisStatus for the given request."""
+    return AnalysisStatus(
+        analysis_id=f"analysis-{request_id}",
+        request_id=request_id,
+        radiography_type="panoramic_adult",
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-01T00:00:00Z",
+        analysis_status=analysis_status,
+    )
+
+
+@pytest.fixture
+async def async_client():
+    """Create an async client; its HTTP client is opened lazily, per loop."""
+    client = AsyncBridgeIQClient(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        device_path="test_device_path",
+        base_url="https://test.api.example.com/api/v1",
+        environment=Environment.TESTING,
+    )
+    yield client
+    await client.close()
+
+
+async def test_check_status_many(async_client):
+    """Test that batched status checks keep the input order."""
+    async def check_status(request_id):
+        return _status(request_id, "COMPLETED")
+    
+    with mock.patch.object(async_client, "check_status", side_effect=check_status):
+        results = await async_client.check_status_many(["b", "a", "c"])
+    
+    assert [status.request_id for status in results] == ["b", "a", "c"]
+
+
+async def test_wait_for_many_stops_polling_finished(async_client):
+    """Test that finished requests are not polled again."""
+    rounds = {"a": ["COMPLETED"], "b": ["PROCESSING", "FAILED"]}
+    
+    async def check_status(request_id):
+        return _status(request_id, rounds[request_id].pop(0))
+    
+    with mock.patch.object(
+        async_client, "check_status", side_effect=check_status
+    ) as mock_check, mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+        results = await async_client.wait_for_many(["a", "b"], poll_interval=0)
+    
+    assert list(results) == ["a", "b"]
+    assert results["a"].is_completed
+    assert results["b"].is_failed
+    assert mock_check.call_count == 3
+
+
+async def test_iter_completed_yields_in_completion_order(async_client):
+    """Test that analyses are yielded as soon as they finish."""
+    rounds = {"a": ["PROCESSING", "COMPLETED"], "b": ["COMPLETED"]}
+    
+    async def check_status(request_id):
+        return _status(request_id, rounds[request_id].pop(0))
+    
+    with mock.patch.object(
+        async_client, "check_status", side_effect=check_status
+    ), mock.patch("asyncio.sleep", new=mock.AsyncMock()):
+        finished = [
+            request_id
+            async for request_id, _ in async_client.iter_completed(
+                ["a", "b"], poll_interval=0, max_concurrency=1
+            )
+        ]
+    
+    assert finished == ["b", "a"]
+
+
+async def test_wait_for_many_timeout(async_client):
+    """Test that unfinished requests raise TimeoutError."""
+    async def check_status(request_id):
+        return _status(request_id, "PROCESSING")
+    
+    with mock.patch.object(async_client, "check_status", side_effect=check_status):
+        with pytest.raises(TimeoutError):
+            await async_client.wait_for_many(["a"], timeout=0.05, poll_interval=0.01)
+
+
+async def test_wait_for_completion_hung_check(async_client):
+    """Test that the timeout also covers a status check that hangs."""
+    async def check_status(request_id):
+        await asyncio.sleep(10)
+    
+    with mock.patch.object(async_client, "check_status", side_effect=check_status):
+        with pytest.raises(TimeoutError):
+            await async_client.wait_for_completion("a", timeout=0.05)
+
+
+async def test_send_analysis_streams_file(async_client, tmp_path):
+    """Test that file uploads are streamed with a Content-Length."""
+    image = os.urandom(3000)
+    received = {}
+    
+    async def handler(request):
+        received["headers"] = request.headers
+        received["body"] = await request.aread()
+        return httpx.Response(200, json={
+            "status": "success",
+            "data": {
+                "analysis_id": "test_analysis_id",
+                "request_id": "test_request_id",
+                "radiography_type": "panoramic_adult",
+                "token_cost": 10,
+                "check_analysis_url": "https://api.example.com/check/test_request_id",
+            },
+        })
+    
+    await async_client.close()
+    async_client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        headers=async_client._get_headers(),
+    )
+    
+    image_path = tmp_path / "scan.dcm"
+    image_path.write_bytes(image)
+    
+    result = await async_client.send_analysis(str(image_path), patient_id="TEST-123")
+    
+    assert result.request_id == "test_request_id"
+    assert received["headers"]["Content-Length"] == str(len(received["body"]))
+    assert "Transfer-Encoding" not in received["headers"]
+    assert received["headers"]["client-id"] == "test_client_id"
+    assert image in received["body"]
+    assert b'filename="scan.dcm"' in received["body"]
+
+
+async def test_share_client_reuses_pool():
+    """Test that shared clients use one pool per base URL."""
+    first, second = (
+        AsyncBridgeIQClient(
+            client_id=client_id,
+            client_secret="test_client_secret",
+            device_path="test_device_path",
+            base_url="https://test.api.example.com/api/v1",
+            share_client=True,
+        )
+        for client_id in ("first", "second")
+    )
+    try:
+        pool = await first._get_client()
+        assert await second._get_client() is pool
+        assert "client-id" not in pool.headers
+        
+        # Closing one instance leaves the shared pool open
+        await first.close()
+        assert not pool.is_closed
+    finally:
+        await AsyncBridgeIQClient.close_shared_clients()
+    assert pool.is_closed
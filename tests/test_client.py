@@ -2,238 +2,433 @@
 Tests for the BridgeIQ client.
 
 These tests verify the functionality of the BridgeIQ client library.
-To run these tests, you need valid API credentials in test_credentials.json.
+They are mock-only: the session's methods are replaced by the fixtures
+in tests/conftest.py, which also fail any request that reaches the
+network. Credentials from test_credentials.json are used if present,
+dummies otherwise.
 """
+import gzip
 import json
 import os
-import sys
-import unittest
-from pathlib import Path
+import random
+import struct
 from unittest import mock
 
-# Add parent directory to path for importing the library
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+import requests
 
 from bridge_iq import BridgeIQClient, Environment
-from bridge_iq.exceptions import ValidationError, AuthenticationError
-
-
-class TestBridgeIQClient(unittest.TestCase):
-    """Tests for the BridgeIQClient class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Load credentials from the JSON file
-        try:
-            with open("test_credentials.json", "r") as f:
-                self.credentials = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.credentials = {
-                "client_id": "test_client_id",
-                "client_secret": "test_client_secret",
-                "api_device_path": "test_device_path",
-                "base_url": "https://test.api.example.com/api/v1"
-            }
-        
-        # Create a client instance with test credentials
-        self.client = BridgeIQClient(
-            client_id=self.credentials.get("client_id"),
-            client_secret=self.credentials.get("client_secret"),
-            device_path=self.credentials.get("api_device_path"),
-            base_url=self.credentials.get("base_url"),
-            environment=Environment.TESTING,  # Use testing for tests
-        )
+from bridge_iq.client import _poll_delay
+from bridge_iq.exceptions import BridgeIQError, ConnectionError, ValidationError
+from bridge_iq.models import StatusLite
+
+
+def _json_response(status_code, payload, headers=None):
+    """Build a mock response with a JSON body.
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.client.close()
-    
-    def test_initialization(self):
-        """Test client initialization."""
-        self.assertEqual(self.client.client_id, self.credentials.get("client_id"))
-        self.assertEqual(self.client.client_secret, self.credentials.get("client_secret"))
-        self.assertEqual(self.client.device_path, self.credentials.get("api_device_path"))
-        self.assertEqual(self.client.base_url, self.credentials.get("base_url"))
-        self.assertEqual(self.client.environment, Environment.TESTING)
-    
-    def test_environment_from_string(self):
-        """Test environment initialization from string."""
-        client = BridgeIQClient(
+    The mock is specced on requests.Response, so the client code cannot
+    read attributes a real response lacks.
+    """
+    response = mock.Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json = mock.Mock(return_value=payload)
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+def _stream_response(status_code, chunks=(), headers=None):
+    """Build a mock streamed response, such as a download or a 304.
+    
+    Specced on requests.Response like ``_json_response``; a MagicMock is
+    used so the client can enter it as a context manager.
+    """
+    response = mock.MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b""
+    response.iter_content.return_value = chunks
+    return response
+
+
+# Canned API responses; tests only read them, so they are built once
+_HEALTHY_RESPONSE = _json_response(200, {
+    "status": "healthy",
+    "message": "Service is running normally",
+})
+_UNHEALTHY_RESPONSE = _json_response(500, {
+    "status": "error",
+    "message": "Service is experiencing issues",
+})
+_SEND_OK = _json_response(200, {
+    "status": "success",
+    "message": "Analysis request submitted successfully",
+    "data": {
+        "analysis_id": "test_analysis_id",
+        "request_id": "550e8400-e29b-41d4-a716-446655440000",
+        "radiography_type": "panoramic_adult",
+        "token_cost": 10,
+        "patient_id": "TEST-123",
+        "check_analysis_url": "https://api.example.com/api/v1/check/550e8400-e29b-41d4-a716-446655440000",
+    },
+})
+_SEND_ERR = _json_response(400, {
+    "status": "error",
+    "message": "Validation error: Invalid radiography type",
+})
+_CHECK_OK = _json_response(200, {
+    "status": "success",
+    "message": "Analysis status retrieved successfully",
+    "data": {
+        "analysis_id": "test_analysis_id",
+        "request_id": "test_request_id",
+        "radiography_type": "panoramic_adult",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:05:00Z",
+        "analysis_status": "COMPLETED",
+        "report_id": "test_report_id",
+        "report_status": "COMPLETED",
+        "pdf_status": "COMPLETED",
+        "report_pdf_link": "https://example.com/report.pdf",
+    },
+})
+
+
+@pytest.fixture(scope="module")
+def expected_auth(credentials):
+    """Credential headers every API request must carry."""
+    return {
+        "client-id": credentials["client_id"],
+        "client-secret": credentials["client_secret"],
+    }
+
+
+@pytest.fixture(scope="module")
+def requests_url_part(credentials):
+    """Path of the device's analysis requests endpoint."""
+    return f"/webhooks/devices/{credentials['api_device_path']}/requests"
+
+
+def _assert_auth_headers(headers, expected_auth):
+    """Assert that headers carry the test client's credentials."""
+    assert {name: headers.get(name) for name in expected_auth} == expected_auth
+
+
+def test_initialization(client, credentials):
+    """Test client initialization."""
+    assert client.client_id == credentials["client_id"]
+    assert client.client_secret == credentials["client_secret"]
+    assert client.device_path == credentials["api_device_path"]
+    assert client.base_url == credentials["base_url"]
+    assert client.environment == Environment.TESTING
+
+
+def test_environment_from_string():
+    """Test environment initialization from string."""
+    client = BridgeIQClient(
+        client_id="test",
+        client_secret="test",
+        device_path="test",
+        base_url="https://api.example.com/api/v1",
+        environment="production",
+    )
+    assert client.environment == Environment.PRODUCTION
+    client.close()
+
+
+def test_invalid_base_url():
+    """Test that a base URL without scheme and host is rejected."""
+    with pytest.raises(ValueError):
+        BridgeIQClient(
+            client_id="test",
+            client_secret="test",
+            device_path="test",
+            base_url="api.example.com/api/v1",
+        )
+
+
+def test_invalid_environment():
+    """Test invalid environment handling."""
+    with pytest.raises(ValueError):
+        BridgeIQClient(
             client_id="test",
             client_secret="test",
             device_path="test",
             base_url="https://api.example.com/api/v1",
-            environment="production",
+            environment="invalid",
+        )
+
+
+def test_health_check(client, mock_get, expected_auth):
+    """Test the health check functionality."""
+    mock_get.return_value = _HEALTHY_RESPONSE
+    
+    # Test the health check method
+    is_healthy = client.health_check()
+    
+    # Verify the result
+    assert is_healthy
+    
+    # Verify the API was called correctly
+    mock_get.assert_called_once()
+    assert "/health" in mock_get.call_args.kwargs["url"]
+    
+    # Verify headers are sent with every session request
+    _assert_auth_headers(client.session.headers, expected_auth)
+
+
+def test_health_check_unhealthy(client, mock_get):
+    """Test the health check with unhealthy API response."""
+    mock_get.return_value = _UNHEALTHY_RESPONSE
+    
+    assert not client.health_check()
+
+
+def test_health_check_cached(client, mock_get):
+    """Test that health check results are reused within the TTL."""
+    mock_get.return_value = _HEALTHY_RESPONSE
+    
+    # Repeated checks within the TTL hit the API once
+    assert client.health_check()
+    assert client.health_check()
+    mock_get.assert_called_once()
+    
+    # Invalidating the cache forces a new request
+    client.invalidate_health_cache()
+    assert client.health_check()
+    assert mock_get.call_count == 2
+
+
+def test_send_analysis(client, mock_post, expected_auth, requests_url_part):
+    """Test sending an analysis request."""
+    mock_post.return_value = _SEND_OK
+    
+    # Test the send_analysis method
+    result = client.send_analysis(
+        image_path=b"fake image data",
+        patient_id="TEST-123",
+        radiography_type="panoramic_adult",
+    )
+    
+    # Verify the result
+    assert result.request_id == "550e8400-e29b-41d4-a716-446655440000"
+    assert result.radiography_type == "panoramic_adult"
+    assert result.token_cost == 10
+    
+    # Verify the API was called correctly
+    mock_post.assert_called_once()
+    kwargs = mock_post.call_args.kwargs
+    assert requests_url_part in kwargs["url"]
+    
+    # Verify headers
+    _assert_auth_headers(kwargs.get("headers", {}), expected_auth)
+
+
+def test_send_analysis_error(client, mock_post):
+    """Test error handling in send_analysis."""
+    mock_post.return_value = _SEND_ERR
+    
+    with pytest.raises(ValidationError):
+        client.send_analysis(
+            image_path=b"fake image data",
+            radiography_type="invalid_type",
         )
-        self.assertEqual(client.environment, Environment.PRODUCTION)
-        client.close()
-    
-    def test_invalid_environment(self):
-        """Test invalid environment handling."""
-        with self.assertRaises(ValueError):
-            BridgeIQClient(
-                client_id="test",
-                client_secret="test",
-                device_path="test",
-                base_url="https://api.example.com/api/v1",
-                environment="invalid",
-            )
-    
-    @mock.patch("requests.Session.get")
-    def test_health_check(self, mock_get):
-        """Test the health check functionality."""
-        # Mock the response for healthy API
-        mock_response = mock.Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "healthy",
-            "message": "Service is running normally",
-        }
-        mock_get.return_value = mock_response
-        
-        # Test the health check method
-        is_healthy = self.client.health_check()
-        
-        # Verify the result
-        self.assertTrue(is_healthy)
-        
-        # Verify the API was called correctly
-        mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        self.assertIn("/health", kwargs.get("url", ""))
-        
-        # Verify headers
-        headers = kwargs.get("headers", {})
-        self.assertIn("client-id", headers)
-        self.assertIn("client-secret", headers)
-        self.assertEqual(headers["client-id"], self.credentials.get("client_id"))
-        self.assertEqual(headers["client-secret"], self.credentials.get("client_secret"))
-    
-    @mock.patch("requests.Session.get")
-    def test_health_check_unhealthy(self, mock_get):
-        """Test the health check with unhealthy API response."""
-        # Mock the response for unhealthy API
-        mock_response = mock.Mock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {
-            "status": "error",
-            "message": "Service is experiencing issues",
-        }
-        mock_get.return_value = mock_response
-        
-        # Test the health check method
-        is_healthy = self.client.health_check()
-        
-        # Verify the result
-        self.assertFalse(is_healthy)
-    
-    @mock.patch("requests.Session.post")
-    def test_send_analysis(self, mock_post):
-        """Test sending an analysis request."""
-        # Mock the response
-        mock_response = mock.Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Analysis request submitted successfully",
-            "data": {
-                "analysis_id": "test_analysis_id",
-                "request_id": "550e8400-e29b-41d4-a716-446655440000",
-                "radiography_type": "panoramic_adult",
-                "token_cost": 10,
-                "patient_id": "TEST-123",
-                "check_analysis_url": "https://api.example.com/api/v1/check/550e8400-e29b-41d4-a716-446655440000",
-            },
-        }
-        mock_post.return_value = mock_response
-        
-        # Create a mock image
-        mock_image_data = b"fake image data"
-        
-        # Test the send_analysis method
-        result = self.client.send_analysis(
-            image_path=mock_image_data,
-            patient_id="TEST-123",
-            radiography_type="panoramic_adult",
+
+
+def test_send_analysis_compressed(client, mock_post, monkeypatch):
+    """Test that uncompressed DICOM uploads are gzipped when enabled."""
+    mock_post.return_value = _SEND_OK
+    
+    # Minimal DICOM file meta group declaring Explicit VR Little Endian
+    uid = b"1.2.840.10008.1.2.1\0"
+    image = (
+        b"\0" * 128 + b"DICM"
+        + struct.pack("<HH2sH", 0x0002, 0x0010, b"UI", len(uid)) + uid
+        + b"\0" * 4096
+    )
+    monkeypatch.setattr(client, "compress_uploads", True)
+    client.send_analysis(image_path=image)
+    
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    body = gzip.decompress(kwargs["data"])
+    assert image in body
+    assert b'name="report_type"' in body
+
+
+def test_check_status(client, mock_get, expected_auth, requests_url_part):
+    """Test checking analysis status."""
+    mock_get.return_value = _CHECK_OK
+    
+    # Test the check_status method
+    result = client.check_status(request_id="test_request_id")
+    
+    # Verify the result
+    assert result.is_completed
+    assert result.has_pdf
+    assert result.report_pdf_link == "https://example.com/report.pdf"
+    
+    # Verify the API was called correctly
+    mock_get.assert_called_once()
+    assert f"{requests_url_part}/test_request_id" in mock_get.call_args.kwargs["url"]
+    
+    # Verify headers are sent with every session request
+    _assert_auth_headers(client.session.headers, expected_auth)
+
+
+def test_check_status_not_modified(client, mock_get):
+    """Test that an unchanged in-progress status is served from the cache."""
+    payload = {
+        "status": "success",
+        "data": {
+            "analysis_id": "test_analysis_id",
+            "request_id": "test_request_id",
+            "radiography_type": "panoramic",
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:05Z",
+            "analysis_status": "PROCESSING",
+        },
+    }
+    mock_get.return_value = _json_response(200, payload, {"ETag": '"s1"'})
+    
+    first = client.check_status("test_request_id")
+    assert first.is_processing
+    
+    # Second check revalidates with the stored ETag
+    mock_get.return_value = _stream_response(304)
+    
+    second = client.check_status("test_request_id")
+    assert second is first
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"s1"'
+
+
+def test_check_status_lightweight(client, mock_get):
+    """Test that a lightweight status check skips model validation."""
+    mock_get.return_value = _json_response(200, {
+        "status": "success",
+        "data": {"request_id": "test_request_id", "analysis_status": "COMPLETED"},
+    })
+    
+    result = client.check_status("test_request_id", lightweight=True)
+    
+    assert isinstance(result, StatusLite)
+    assert result.is_completed
+    assert result.report_pdf_link is None
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+
+def test_check_status_lightweight_missing_field(client, mock_get):
+    """Test that a lightweight check rejects a payload without a status."""
+    mock_get.return_value = _json_response(200, {
+        "status": "success",
+        "data": {"request_id": "test_request_id"},
+    })
+    
+    with pytest.raises(BridgeIQError, match="analysis_status"):
+        client.check_status("test_request_id", lightweight=True)
+
+def test_download_report_not_modified(client, mock_get, tmp_path):
+    """Test that an unchanged report is not downloaded again."""
+    output_path = tmp_path / "report.pdf"
+    
+    # First download stores the report and its ETag
+    mock_get.return_value = _stream_response(
+        200, [b"%PDF-", b"1.4"], {"ETag": '"v1"'}
+    )
+    
+    client.download_report(
+        "https://example.com/report.pdf", output_path, revalidate=True
+    )
+    assert output_path.read_bytes() == b"%PDF-1.4"
+    
+    # Second download revalidates with the stored ETag
+    mock_response = _stream_response(304)
+    mock_get.return_value = mock_response
+    
+    result = client.download_report(
+        "https://example.com/report.pdf", output_path, revalidate=True
+    )
+    assert result == output_path
+    assert output_path.read_bytes() == b"%PDF-1.4"
+    
+    headers = mock_get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["Accept-Encoding"] == "identity"
+    assert headers["client-id"] is None
+    mock_response.iter_content.assert_not_called()
+
+
+def test_download_report_other_url(client, mock_get, tmp_path):
+    """Test that an ETag is only sent for the URL it was stored for."""
+    output_path = tmp_path / "report.pdf"
+    
+    mock_get.return_value = _stream_response(
+        200, [b"%PDF-", b"1.4"], {"ETag": '"v1"'}
+    )
+    
+    client.download_report(
+        "https://example.com/first.pdf", output_path, revalidate=True
+    )
+    
+    mock_get.return_value = _stream_response(
+        200, [b"%PDF-", b"1.7"], {"ETag": '"v2"'}
+    )
+    client.download_report(
+        "https://example.com/second.pdf", output_path, revalidate=True
+    )
+    
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    assert output_path.read_bytes() == b"%PDF-1.7"
+
+
+def test_download_report_no_etag_file(client, mock_get, tmp_path):
+    """Test that no ETag file is written unless revalidation is requested."""
+    output_path = tmp_path / "report.pdf"
+    
+    mock_get.return_value = _stream_response(
+        200, [b"%PDF-", b"1.4"], {"ETag": '"v1"'}
+    )
+    
+    client.download_report("https://example.com/report.pdf", output_path)
+    
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    assert os.listdir(tmp_path) == ["report.pdf"]
+
+
+def test_download_report_interrupted(client, mock_get, tmp_path):
+    """Test that a failed download keeps the previous report and ETag."""
+    def broken_stream():
+        yield b"%PDF-"
+        raise requests.ConnectionError("connection reset")
+    
+    output_path = tmp_path / "report.pdf"
+    output_path.write_bytes(b"%PDF-1.4")
+    etag_path = tmp_path / "report.pdf.etag"
+    etag_path.write_text(
+        json.dumps({"url": "https://example.com/report.pdf", "etag": '"v1"'})
+    )
+    
+    mock_get.return_value = _stream_response(
+        200, broken_stream(), {"ETag": '"v2"'}
+    )
+    
+    with pytest.raises(ConnectionError):
+        client.download_report(
+            "https://example.com/report.pdf", output_path, revalidate=True
         )
-        
-        # Verify the result
-        self.assertEqual(result.request_id, "550e8400-e29b-41d4-a716-446655440000")
-        self.assertEqual(result.radiography_type, "panoramic_adult")
-        self.assertEqual(result.token_cost, 10)
-        
-        # Verify the API was called correctly
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        self.assertIn(f"/webhooks/devices/{self.credentials.get('api_device_path')}/requests", kwargs.get("url", ""))
-        
-        # Verify headers
-        headers = kwargs.get("headers", {})
-        self.assertIn("client-id", headers)
-        self.assertIn("client-secret", headers)
-        self.assertEqual(headers["client-id"], self.credentials.get("client_id"))
-        self.assertEqual(headers["client-secret"], self.credentials.get("client_secret"))
-    
-    @mock.patch("requests.Session.post")
-    def test_send_analysis_error(self, mock_post):
-        """Test error handling in send_analysis."""
-        # Mock the error response
-        mock_response = mock.Mock()
-        mock_response.status_code = 400
-        mock_response.json.return_value = {
-            "status": "error",
-            "message": "Validation error: Invalid radiography type",
-        }
-        mock_post.return_value = mock_response
-        
-        # Create a mock image
-        mock_image_data = b"fake image data"
-        
-        # Test the send_analysis method with invalid data
-        with self.assertRaises(ValidationError):
-            self.client.send_analysis(
-                image_path=mock_image_data,
-                radiography_type="invalid_type",
-            )
-    
-    @mock.patch("requests.Session.get")
-    def test_check_analysis(self, mock_get):
-        """Test checking analysis status."""
-        # Mock the response
-        mock_response = mock.Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "success",
-            "message": "Analysis status retrieved successfully",
-            "data": {
-                "analysis_status": "completed",
-                "report_status": "completed",
-                "pdf_status": "completed",
-                "report_pdf_link": "https://example.com/report.pdf",
-            },
-        }
-        mock_get.return_value = mock_response
-        
-        # Test the check_analysis method
-        result = self.client.check_analysis(request_id="test_request_id")
-        
-        # Verify the result
-        self.assertTrue(result.is_completed)
-        self.assertTrue(result.has_pdf)
-        self.assertEqual(result.report_pdf_link, "https://example.com/report.pdf")
-        
-        # Verify the API was called correctly
-        mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        self.assertIn("/check/test_request_id", kwargs.get("url", ""))
-        
-        # Verify headers
-        headers = kwargs.get("headers", {})
-        self.assertIn("client-id", headers)
-        self.assertIn("client-secret", headers)
-        self.assertEqual(headers["client-id"], self.credentials.get("client_id"))
-        self.assertEqual(headers["client-secret"], self.credentials.get("client_secret"))
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    
+    assert output_path.read_bytes() == b"%PDF-1.4"
+    assert json.loads(etag_path.read_text())["etag"] == '"v1"'
+    assert sorted(os.listdir(tmp_path)) == ["report.pdf", "report.pdf.etag"]
+
+
+def test_poll_delay_long_wait():
+    """Test that the poll delay stays capped after many polls."""
+    rng = random.Random(0)
+    
+    for attempt in (0, 10, 5000):
+        delay = _poll_delay(attempt, poll_interval=1.0, remaining=3600.0, rng=rng)
+        assert 0.0 < delay <= 1.0
+    
+    # The delay never outlasts the remaining time
+    assert _poll_delay(5000, poll_interval=30.0, remaining=0.5, rng=rng) <= 0.5
@@ -0,0 +1,51 @@
+"""
+Tests for the lazy package imports.
+
+These tests verify that importing the BridgeIQ package does not eagerly
+load the client, the models or their third-party dependencies.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(code):
+    """Run code in a fresh interpreter and return its stripped stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_submodules():
+    """Test that importing the package loads no heavy modules."""
+    output = _run(
+        "import sys, bridge_iq; "
+        "print(sorted(m for m in ('httpx', 'pydantic', 'bridge_iq.client', "
+        "'bridge_iq.models') if m in sys.modules))"
+    )
+    assert output == "[]"
+
+
+def test_exceptions_do_not_load_client():
+    """Test that exception types are importable on their own."""
+    output = _run(
+        "import sys, bridge_iq; bridge_iq.AuthenticationError; "
+        "print('bridge_iq.client' in sys.modules, 'bridge_iq.models' in sys.modules)"
+    )
+    assert output == "False False"
+
+
+def test_sync_client_does_not_load_httpx():
+    """Test that the sync client can be used without loading httpx."""
+    output = _run(
+        "import sys; from bridge_iq import BridgeIQClient; "
+        "print(sorted(m for m in ('httpx', 'anyio', 'h11') if m in sys.modules))"
+    )
+    assert output == "[]"
@@ -0,0 +1,51 @@
+"""
+Tests for the BridgeIQ logger setup.
+
+These tests verify that queued file logging keeps working in processes
+forked after the logger was set up.
+"""
+import os
+import signal
+import time
+
+import pytest
+
+from bridge_iq.logger import setup_logger
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_file_logging_from_forked_child(tmp_path):
+    """Test that a forked child's records reach the log file."""
+    log_file = tmp_path / "fork.log"
+    logger = setup_logger("bridge_iq.test_fork", log_to_file=True, log_file=log_file)
+    try:
+        # Start the listener thread in the parent before forking
+        logger.info("from parent")
+        
+        pid = os.fork()
+        if pid == 0:
+            try:
+                logger.info("from child")
+                for handler in logger.handlers:
+                    handler.flush()
+            finally:
+                os._exit(0)
+        
+        # A child whose records are never written blocks in flush()
+        deadline = time.monotonic() + 10
+        while os.waitpid(pid, os.WNOHANG) == (0, 0):
+            if time.monotonic() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                pytest.fail("forked child could not flush its log records")
+            time.sleep(0.01)
+        
+        for handler in logger.handlers:
+            handler.flush()
+        content = log_file.read_text()
+        assert "from parent" in content
+        assert "from child" in content
+    finally:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
@@ -0,0 +1,71 @@
+"""
+Tests for the BridgeIQ data models.
+
+These tests verify how API payloads are parsed into models.
+"""
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+
+from bridge_iq.models import AnalysisRequest, AnalysisStatus
+
+
+@pytest.fixture
+def status_data():
+    """Status payload with timestamps in two ISO formats."""
+    return {
+        "analysis_id": "test_analysis_id",
+        "request_id": "test_request_id",
+        "radiography_type": "panoramic_adult",
+        "created_at": "2024-01-01T10:00:00Z",
+        "updated_at": "2024-01-01T13:00:05.250+03:00",
+        "analysis_status": "PROCESSING",
+    }
+
+
+@pytest.fixture
+def request_data():
+    """Payload of a submitted analysis request."""
+    return {
+        "analysis_id": "test_analysis_id",
+        "request_id": "550e8400-e29b-41d4-a716-446655440000",
+        "radiography_type": "panoramic_adult",
+        "token_cost": 10,
+        "check_analysis_url": "https://api.example.com/api/v1/check/550e8400-e29b-41d4-a716-446655440000",
+    }
+
+
+def test_timestamps_parsed_once(status_data):
+    """Test that ISO timestamps, including a Z suffix, become datetimes."""
+    status = AnalysisStatus.model_validate(status_data)
+    
+    assert status.created_at == datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+    assert status.updated_at.utcoffset().total_seconds() == 3 * 3600
+    assert status.created_at < status.updated_at
+
+
+def test_datetime_aliases(status_data):
+    """Test that the legacy *_datetime properties return the fields."""
+    status = AnalysisStatus.model_validate(status_data)
+    
+    assert status.created_datetime is status.created_at
+    assert status.updated_datetime is status.updated_at
+
+
+def test_uuid_cached(request_data):
+    """Test that the request ID is parsed once and reused."""
+    request = AnalysisRequest.model_validate(request_data)
+    
+    assert request.uuid == UUID(request_data["request_id"])
+    assert request.uuid is request.uuid
+
+
+def test_equality_ignores_cached_uuid(request_data):
+    """Test that accessing uuid does not change equality."""
+    first = AnalysisRequest.model_validate(request_data)
+    second = AnalysisRequest.model_validate(request_data)
+    
+    first.uuid
+    assert first == second
+    assert second == first
@@ -0,0 +1,82 @@
+"""
+Tests for the streaming multipart body.
+
+These tests verify that the streamed upload body matches the encoding
+requests produces for the same form and can be rewound for retries.
+"""
+import io
+import os
+
+import pytest
+import requests
+
+from bridge_iq._multipart import MultipartStream
+
+_FIELDS = {"report_type": "standard", "patient_id": "TEST-123"}
+
+
+@pytest.fixture
+def image():
+    """Random image bytes larger than a single read."""
+    return os.urandom(3000)
+
+
+def _requests_encoding(image, boundary):
+    """Encode the test form with requests and the given boundary."""
+    files = {"image": ("scan.dcm", image)}
+    files.update((name, (None, value)) for name, value in _FIELDS.items())
+    body, content_type = requests.models.RequestEncodingMixin._encode_files(files, {})
+    old_boundary = content_type.split("boundary=")[1]
+    return body.replace(old_boundary.encode(), boundary.encode())
+
+
+def _parts(body, boundary):
+    """Split a multipart body into its sorted parts."""
+    return sorted(body.split(f"--{boundary}".encode()))
+
+
+def test_matches_requests_encoding(image):
+    """Test that the streamed body encodes the same parts as requests."""
+    stream = MultipartStream(
+        _FIELDS, "image", "scan.dcm", io.BytesIO(image), len(image)
+    )
+    body = stream.read()
+    
+    assert len(body) == len(stream)
+    assert _parts(body, stream.boundary) == _parts(
+        _requests_encoding(image, stream.boundary), stream.boundary
+    )
+
+
+def test_chunked_reads_and_rewind(image):
+    """Test that small reads and seeking reproduce the full body."""
+    stream = MultipartStream(_FIELDS, "image", "scan.dcm", image, len(image))
+    expected = stream.read()
+    
+    stream.seek(0)
+    chunks = []
+    while True:
+        chunk = stream.read(7)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    assert b"".join(chunks) == expected
+    
+    stream.seek(100)
+    assert stream.tell() == 100
+    assert b"".join(stream) == expected[100:]
+
+
+def test_prepared_request_streams_body(image):
+    """Test that requests sends the body as a stream with a length."""
+    stream = MultipartStream(
+        _FIELDS, "image", "scan.dcm", io.BytesIO(image), len(image)
+    )
+    prepared = requests.Request(
+        "POST", "https://api.example.com/upload", data=stream,
+        headers={"Content-Type": stream.content_type},
+    ).prepare()
+    
+    assert prepared.body is stream
+    assert prepared.headers["Content-Length"] == str(len(stream))
+    assert "Transfer-Encoding" not in prepared.headers
@@ -0,0 +1,21 @@
+"""
+Tests for the example and diagnostic scripts.
+
+These tests verify that the scripts at the repository root parse, so a
+syntax error there is caught before anyone tries to run them.
+"""
+import ast
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPTS = ("diagnostic_test.py", "example.py", "simple_test.py")
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_script_parses(script):
+    """Test that the script is valid Python source."""
+    path = PROJECT_ROOT / script
+    ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
@@ -0,0 +1,74 @@
+"""
+Tests for the BridgeIQ utility functions.
+
+These tests verify file format detection and file helpers without
+touching the network.
+"""
+import struct
+
+import pytest
+
+from bridge_iq.utils import (
+    aget_file_content,
+    asave_file,
+    dicom_transfer_syntax,
+    is_dicom_file,
+)
+
+
+def _dicom_header(transfer_syntax):
+    """Build a DICOM preamble and file meta group with a transfer syntax."""
+    uid = transfer_syntax.encode() + b"\0" * (len(transfer_syntax) % 2)
+    return (
+        b"\0" * 128 + b"DICM"
+        + struct.pack("<HH2sHI", 0x0002, 0x0000, b"UL", 4, 0)
+        + struct.pack("<HH2s2xI", 0x0002, 0x0001, b"OB", 2) + b"\0\1"
+        + struct.pack("<HH2sH", 0x0002, 0x0010, b"UI", len(uid)) + uid
+    )
+
+
+def test_dicom_magic_bytes():
+    """Test detection of the DICM marker after the preamble."""
+    assert is_dicom_file(b"\0" * 128 + b"DICM" + b"\0" * 16)
+
+
+def test_rvg_signature():
+    """Test detection of RVG signatures in the file header."""
+    assert is_dicom_file(b"RVGIMG" + b"\0" * 200)
+    assert not is_dicom_file(b"\0" * 120 + b"RVGIMG" + b"\0" * 100)
+
+
+def test_filename_extension():
+    """Test that the file name, not the content, decides by extension."""
+    assert is_dicom_file(b"", filename="scan.DCM")
+    assert is_dicom_file(b"", filename="scan.rvg")
+    assert not is_dicom_file(b"\0" * 200 + b".dcm")
+
+
+def test_reads_transfer_syntax():
+    """Test that the UID is found after long and short VR elements."""
+    header = _dicom_header("1.2.840.10008.1.2.4.50")
+    assert dicom_transfer_syntax(header) == "1.2.840.10008.1.2.4.50"
+
+
+def test_transfer_syntax_not_dicom_or_truncated():
+    """Test that non-DICOM and truncated headers return None."""
+    header = _dicom_header("1.2.840.10008.1.2.1")
+    assert dicom_transfer_syntax(b"\0" * 200) is None
+    assert dicom_transfer_syntax(header[:-4]) is None
+
+
+@pytest.mark.anyio
+async def test_async_save_and_read_round_trip(tmp_path):
+    """Test that asave_file output is read back by aget_file_content."""
+    path = await asave_file(b"%PDF-1.4", tmp_path / "nested" / "report.pdf")
+    
+    assert path.exists()
+    assert await aget_file_content(path) == b"%PDF-1.4"
+
+
+@pytest.mark.anyio
+async def test_async_read_missing_file(tmp_path):
+    """Test that reading a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        await aget_file_content(tmp_path / "report.pdf")